@@ -16,12 +16,38 @@ import os
 import time
 import shutil
 import venv
+import tempfile
 import json
+import re
 import itertools
 import threading
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from colorama import Fore, Style, init
 from typing import List, Optional
 
+# [AI]: tomllib is part of the standard library from Python 3.11; fall back to the tomli backport
+try:
+    import tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+# [AI]: packaging gives exact specifier matching when it is available; otherwise only pinned lines are compared
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ModuleNotFoundError:
+    Requirement = None
+
+# [AI]: orjson is a faster drop-in for the package.json round-trip; the stdlib json module is the fallback
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 # [AI]: Initialize colorama for cross-platform colored terminal output
 init(autoreset=True)
 
@@ -55,6 +81,58 @@ def prompt_message(message: str) -> str:
 def file_path_message(message: str) -> str:
     return format_message(message, INFO_COLOR)
 
+# [AI]: Serialize console output from the concurrently running installers
+print_lock = threading.Lock()
+
+# [AI]: One status line shared by the concurrently running installers. Each installer owns a labelled
+# segment, and the whole line is redrawn on every update so neither indicator overwrites the other.
+class StatusLine:
+    def __init__(self):
+        self._segments = {}
+        self._drawn_width = 0
+
+    def update(self, label, text):
+        with print_lock:
+            self._segments[label] = text
+            self._draw()
+
+    def clear(self, label):
+        with print_lock:
+            self._segments.pop(label, None)
+            self._erase()
+            self._draw()
+
+    # [AI]: The callers below must hold print_lock
+    def _erase(self):
+        if self._drawn_width:
+            sys.stdout.write("\r" + " " * self._drawn_width + "\r")
+            self._drawn_width = 0
+        sys.stdout.flush()
+
+    def _draw(self):
+        if not self._segments:
+            return
+        # [AI]: Stay within one terminal row, since a wrapped line can no longer be redrawn with a carriage return
+        width = shutil.get_terminal_size().columns - 1
+        line = " | ".join(f"{label}: {text}" for label, text in self._segments.items())[:width]
+        sys.stdout.write("\r" + info_message(line.ljust(self._drawn_width)))
+        sys.stdout.flush()
+        self._drawn_width = len(line)
+
+status_line = StatusLine()
+
+# [AI]: Print a message above the status line, redrawing the status line underneath it afterwards
+def locked_print(*args, **kwargs):
+    with print_lock:
+        status_line._erase()
+        print(*args, **kwargs)
+        status_line._draw()
+
+# [AI]: Progress bars for every fill level, built once instead of on each update. The bar is 25 cells rather
+# than the earlier 50 so the Python segment and the Node.js segment fit together on one 80-column row.
+PROGRESS_BAR_LENGTH = 25
+PROGRESS_BARS = ['=' * filled + '-' * (PROGRESS_BAR_LENGTH - filled) for filled in range(PROGRESS_BAR_LENGTH + 1)]
+
 # [AI]: Set up logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -69,20 +147,19 @@ def check_python():
         print(error_message("\nPython is not installed or not accessible."))
         return False
 
-# [AI]: Get the path to the npm executable, considering different platforms and common installation locations
-def get_npm_path():
-    npm_cmd = 'npm.cmd' if sys.platform.startswith('win') else 'npm'
+# [AI]: Get the path to the npm executable, considering different platforms and common installation locations.
+# The result is memoized per platform since the lookup probes PATH and may launch npm.
+@functools.lru_cache(maxsize=None)
+def get_npm_path(platform=sys.platform):
+    npm_cmd = 'npm.cmd' if platform.startswith('win') else 'npm'
     npm_path = shutil.which(npm_cmd)
     
+    # [AI]: A PATH hit is trusted as-is; a broken npm still surfaces when the install itself runs
     if npm_path:
-        try:
-            subprocess.run([npm_path, "--version"], check=True, capture_output=True)
-            return npm_path
-        except subprocess.CalledProcessError:
-            pass
+        return npm_path
     
-    # [AI]: Check common npm locations on Windows
-    if sys.platform.startswith('win'):
+    # [AI]: Check common npm locations on Windows, verifying each since these are only guesses
+    if platform.startswith('win'):
         common_locations = [
             r"C:\Program Files\nodejs\npm.cmd",
             r"C:\Program Files (x86)\nodejs\npm.cmd",
@@ -102,150 +179,282 @@ def get_npm_path():
 # [AI]: Create a virtual environment if it doesn't exist
 def create_venv(venv_path):
     venv_path = Path(venv_path)
-    if not venv_path.exists():
-        print(info_message(f"Creating virtual environment at {file_path_message(str(venv_path))}"))
-        venv.create(venv_path, with_pip=True)
-    else:
-        print(info_message(f"Virtual environment already exists at {file_path_message(str(venv_path))}"))
+    # [AI]: pyvenv.cfg is what marks a directory as a usable venv; reuse it as-is instead of re-running ensurepip
+    if (venv_path / "pyvenv.cfg").exists():
+        locked_print(info_message(f"Virtual environment already exists at {file_path_message(str(venv_path))}"))
+        return
+
+    locked_print(info_message(f"Creating virtual environment at {file_path_message(str(venv_path))}"))
+    builder = venv.EnvBuilder(
+        with_pip=True,
+        symlinks=not sys.platform.startswith('win'),
+        system_site_packages=False,
+        upgrade_deps=False,
+    )
+    builder.create(venv_path)
 
 # [AI]: Get the path to the Python executable in the virtual environment
+@functools.lru_cache(maxsize=None)
 def get_venv_python(venv_path):
     venv_path = Path(venv_path)
     return venv_path / "Scripts" / "python.exe" if sys.platform.startswith('win') else venv_path / "bin" / "python"
 
-# [AI]: Find a file by name in the current directory or its subdirectories
-def find_file(filename, search_path=None):
+# [AI]: Directories that never contain the project's own manifests and are expensive to walk
+SKIP_DIRS = {"node_modules", ".git", "venv", ".venv", "__pycache__", "dist", "build"}
+
+# [AI]: Find several files by name in one walk of the current directory or its subdirectories.
+# Returns a dict of the names that were found to their paths.
+def find_files(filenames, search_path=None):
     if search_path is None:
         search_path = Path.cwd()
-    for root, _, files in os.walk(search_path):
-        if filename in files:
-            return Path(root) / filename
-    return None
+    return dict(_find_files_cached(frozenset(filenames), Path(search_path).resolve()))
 
-# [AI]: Install Python dependencies from requirements.txt
-def install_python_deps(venv_path):
-    requirements_file = find_file("requirements.txt")
-    if not requirements_file:
-        print(error_message("requirements.txt not found in the project directory."))
+# [AI]: Find a file by name in the current directory or its subdirectories
+def find_file(filename, search_path=None):
+    return find_files((filename,), search_path).get(filename)
+
+@functools.lru_cache(maxsize=None)
+def _find_files_cached(filenames, search_path):
+    # [AI]: Manifests usually sit at the top of the search path, so try it before walking
+    found = {name: search_path / name for name in filenames if (search_path / name).is_file()}
+
+    stack = [str(search_path)]
+    while stack and len(found) < len(filenames):
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if entry.name in filenames and entry.name not in found:
+                            found[entry.name] = Path(entry.path)
+                    elif entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # [AI]: Push in reverse so directories are visited in listing order, as os.walk would
+        stack.extend(reversed(subdirs))
+    return found
+
+# [AI]: Run a command, handing each output line to on_line as it arrives and keeping only the last lines for error reporting
+def run_streaming(command, on_line, env=None, timeout=None, tail_lines=20):
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env)
+    tail = collections.deque(maxlen=tail_lines)
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+    try:
+        with process.stdout:
+            for line in process.stdout:
+                tail.append(line)
+                on_line(line)
+        process.wait()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        if timer:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout, output="".join(tail))
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, output="".join(tail))
+
+# [AI]: Normalize a distribution name the way pip does (PEP 503)
+def canonicalize_name(name):
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+# [AI]: Map the canonical names of packages installed in the venv to their versions
+def get_installed_packages(venv_python):
+    result = subprocess.run([str(venv_python), "-m", "pip", "freeze", "--local"], capture_output=True, text=True)
+    installed = {}
+    for line in result.stdout.splitlines():
+        name, separator, version = line.partition("==")
+        if separator:
+            installed[canonicalize_name(name)] = version.strip()
+    return installed
+
+# [AI]: Check whether a requirements.txt line is already satisfied by the installed packages
+def is_requirement_satisfied(requirement, installed):
+    if Requirement is None:
+        name, separator, version = requirement.partition("==")
+        return bool(separator) and installed.get(canonicalize_name(name)) == version.strip()
+
+    try:
+        parsed = Requirement(requirement)
+    except InvalidRequirement:
+        # [AI]: Options, editable installs and the like are always handed to pip
+        return False
+    if parsed.url or parsed.extras or parsed.marker:
         return False
+    version = installed.get(canonicalize_name(parsed.name))
+    return version is not None and parsed.specifier.contains(version, prereleases=True)
 
+# [AI]: Install Python dependencies from requirements.txt
+def install_python_deps(venv_path, requirements_file):
     create_venv(venv_path)
     venv_python = get_venv_python(venv_path)
     if not venv_python.exists():
-        print(error_message(f"Virtual environment Python not found at {venv_python}"))
+        locked_print(error_message(f"Virtual environment Python not found at {venv_python}"))
         return False
 
-    print(info_message(f"Using Python from virtual environment: {file_path_message(str(venv_python))}"))
-    with open(requirements_file, 'r') as f:
-        requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    locked_print(info_message(f"Using Python from virtual environment: {file_path_message(str(venv_python))}"))
+    text = Path(requirements_file).read_text(encoding="utf-8-sig")
+    requirements = [line for line in map(str.strip, text.splitlines()) if line and not line.startswith('#')]
+
+    # [AI]: Only hand pip the requirements the venv does not already satisfy
+    installed = get_installed_packages(venv_python)
+    missing = [requirement for requirement in requirements if not is_requirement_satisfied(requirement, installed)]
+    if len(missing) < len(requirements):
+        locked_print(info_message(f"Skipping {len(requirements) - len(missing)} Python packages that are already installed."))
+    requirements = missing
+    if not requirements:
+        locked_print(success_message("All Python packages are already installed."))
+        return True
 
     total_packages = len(requirements)
-    print(info_message(f"Installing {total_packages} Python packages..."))
+    locked_print(info_message(f"Installing {total_packages} Python packages..."))
 
-    start_time = time.time()
-    for i, package in enumerate(requirements, 1):
-        try:
-            subprocess.run([str(venv_python), "-m", "pip", "install", package], check=True, capture_output=True, timeout=300)
-            progress = i / total_packages
-            bar_length = 50
-            filled_length = int(bar_length * progress)
-            bar = '=' * filled_length + '-' * (bar_length - filled_length)
-            elapsed_time = time.time() - start_time
-            estimated_total_time = elapsed_time / progress
-            time_left = estimated_total_time - elapsed_time
-            print(f"\r{info_message(f'[{bar}] {i}/{total_packages} ({progress:.1%}) - ETA: {time_left:.0f}s')}", end='', flush=True)
-        except subprocess.CalledProcessError as e:
-            print(error_message(f"\nError installing {package}: {e}"))
-            return False
-        except subprocess.TimeoutExpired:
-            print(error_message(f"\nTimeout while installing {package}. The package may be too large or the network connection is slow."))
-            return False
-        except KeyboardInterrupt:
-            print(warning_message("\nWARNING:", "Installation process interrupted by user."))
-            return False
-
-    print(success_message("\nAll Python packages installed successfully."))
-    return True
+    # [AI]: Reuse pip's HTTP/wheel cache across runs and skip interactive prompts and version checks
+    env = {
+        **os.environ,
+        "PIP_CACHE_DIR": os.environ.get("PIP_CACHE_DIR", str(Path.home() / ".cache" / "pip")),
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+    }
 
-# [AI]: Spinner animation for Node.js package installation
-def spinner_task(stop_event):
-    spinner = itertools.cycle(['-', '/', '|', '\\'])
-    while not stop_event.is_set():
-        print(f"\r{info_message('Installing Node.js packages...')} {next(spinner)}", end='', flush=True)
-        time.sleep(0.1)
+    count_width = len(str(total_packages))
+    start_time = time.time()
+    collected = 0
+
+    # [AI]: Advance the bar on pip's log lines for top-level requirements. Those are tagged "(from -r <file> ...)",
+    # while dependencies carry a "(from <package>)" suffix.
+    def report_progress(line):
+        nonlocal collected
+        if not line.startswith(("Collecting ", "Requirement already satisfied: ")) or "(from " in line.replace("(from -r ", ""):
+            return
+        collected = min(collected + 1, total_packages)
+        progress = collected / total_packages
+        bar = PROGRESS_BARS[int(PROGRESS_BAR_LENGTH * progress)]
+        elapsed_time = time.time() - start_time
+        time_left = elapsed_time / progress - elapsed_time
+        status_line.update("Python", f"[{bar}] {collected:>{count_width}}/{total_packages} - ETA: {time_left:.0f}s")
+
+    # [AI]: Hand every missing requirement to a single pip process so it resolves once and downloads in one session.
+    # The lines go through a temporary requirements file next to the original, so pip parses markers, extras,
+    # URLs, options and comments itself and nested "-r" references still resolve relative to the same directory.
+    requirements_dir = Path(requirements_file).resolve().parent
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", prefix=".requirements-", dir=requirements_dir, delete=False) as tmp:
+        tmp.write("\n".join(requirements) + "\n")
+    command = [str(venv_python), "-m", "pip", "install", "--prefer-binary", "--progress-bar", "off", "-r", tmp.name]
 
-# [AI]: Install Node.js dependencies using npm
-def install_node_deps():
-    package_json = find_file("package.json")
-    if not package_json:
-        print(error_message("package.json not found in the project directory."))
+    try:
+        run_streaming(command, report_progress, env=env, timeout=300 * total_packages)
+    except subprocess.CalledProcessError as e:
+        locked_print(error_message(f"\nError installing Python packages: pip exited with status {e.returncode}"))
+        if e.output:
+            locked_print(error_message(f"Error output:\n{e.output}"))
         return False
-
-    npm_path = get_npm_path()
-    if not npm_path:
-        print(error_message("Npm is not installed or not accessible."))
+    except subprocess.TimeoutExpired:
+        locked_print(error_message("\nTimeout while installing Python packages. A package may be too large or the network connection is slow."))
         return False
+    finally:
+        os.unlink(tmp.name)
+        status_line.clear("Python")
 
+    locked_print(success_message(f"All {total_packages} Python packages installed successfully."))
+    return True
+
+# [AI]: Install Node.js dependencies using npm
+def install_node_deps(package_json, npm_path):
     try:
-        os.chdir(package_json.parent)
-        
-        print(info_message("Starting Node.js package installation..."))
-        
-        command = [npm_path, "install"]
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        
-        # [AI]: Start spinner animation in a separate thread
-        stop_event = threading.Event()
-        spinner_thread = threading.Thread(target=spinner_task, args=(stop_event,))
-        spinner_thread.start()
-        
-        stdout, stderr = process.communicate()
-        
-        # [AI]: Stop spinner animation
-        stop_event.set()
-        spinner_thread.join()
-        print("\r", end='', flush=True)  # Clear the spinner line
+        locked_print(info_message("Starting Node.js package installation..."))
         
+        # [AI]: Prefer a deterministic lockfile install when package-lock.json is present
+        npm_flags = ["--prefer-offline", "--no-audit", "--no-fund"]
+        if (package_json.parent / "package-lock.json").exists():
+            command = [npm_path, "ci", *npm_flags]
+        else:
+            command = [npm_path, "install", *npm_flags]
+
+        # [AI]: Keep npm's download cache in a persistent location so repeat runs stay offline
+        env = {
+            **os.environ,
+            "npm_config_cache": os.environ.get("npm_config_cache", str(Path.home() / ".npm")),
+        }
+        # [AI]: Send stderr to a temporary file so the pipe can never fill up while nobody reads it,
+        # which lets this thread drive the spinner itself while polling the process
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=stderr_file, env=env, cwd=package_json.parent)
+
+            spinner = itertools.cycle(['-', '/', '|', '\\'])
+            try:
+                while True:
+                    status_line.update("Node.js", f"installing packages... {next(spinner)}")
+                    try:
+                        process.wait(timeout=0.1)
+                        break
+                    except subprocess.TimeoutExpired:
+                        continue
+            finally:
+                status_line.clear("Node.js")
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
         if process.returncode != 0:
-            print(error_message(f"\nnpm install failed with return code {process.returncode}"))
-            print(error_message(f"Error output: {stderr}"))
+            locked_print(error_message(f"\nnpm {command[1]} failed with return code {process.returncode}"))
+            locked_print(error_message(f"Error output: {stderr}"))
             raise subprocess.CalledProcessError(process.returncode, command, output=stderr)
         
-        print(success_message("Node.js package installation completed successfully."))
+        locked_print(success_message("Node.js package installation completed successfully."))
         return True
     except subprocess.CalledProcessError as e:
-        print(error_message(f"\nError during Node.js package installation. Command '{e.cmd}' returned non-zero exit status {e.returncode}."))
-        print(error_message(f"Error output: {e.output}"))
+        locked_print(error_message(f"\nError during Node.js package installation. Command '{e.cmd}' returned non-zero exit status {e.returncode}."))
+        locked_print(error_message(f"Error output: {e.output}"))
         return False
     except Exception as e:
-        print(error_message(f"\nUnexpected error during Node.js package installation: {e}"))
+        locked_print(error_message(f"\nUnexpected error during Node.js package installation: {e}"))
         return False
-    finally:
-        os.chdir(Path.cwd())
 
-# [AI]: Update package.json name and settings.lcl.toml with the project name
-def update_package_json_name():
-    package_json = find_file("package.json")
-    if not package_json:
-        print(warning_message("WARNING:", "package.json not found. Skipping package name update."))
-        return
+# [AI]: Read and write JSON files with orjson when available, matching npm's two-space layout and trailing newline
+def read_json_file(path):
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
+def write_json_file(path, data):
+    if orjson:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    Path(path).write_bytes(content)
+
+# [AI]: Update package.json name and settings.lcl.toml with the project name
+def update_package_json_name(package_json):
     # [AI]: Get the project name from the root directory
     root_dir = package_json.parent.parent
     project_name = root_dir.name.lower()
 
     # [AI]: Update package.json
     try:
-        with package_json.open("r") as f:
-            package_data = json.load(f)
+        package_data = read_json_file(package_json)
 
         old_name = package_data.get("name", "")
         new_name = f"{project_name}-frontend"
         
+        # [AI]: Leave the file (and its mtime) untouched unless the name actually changes
         if old_name != new_name:
             package_data["name"] = new_name
-            with package_json.open("w") as f:
-                json.dump(package_data, f, indent=2)
+            write_json_file(package_json, package_data)
             print(info_message(f"\nUpdated package.json name from '{old_name}' to '{new_name}'"))
         else:
             print(info_message("\npackage.json name is already up to date."))
@@ -258,33 +467,17 @@ def update_package_json_name():
     # [AI]: Update settings.lcl.toml
     settings_file = root_dir / "backend" / "config" / "settings.lcl.toml"
     try:
-        # Read the TOML file
-        with settings_file.open("r") as f:
-            settings_content = f.read()
-
-        # [AI]: Simple TOML parsing and updating
-        updated_lines = []
-        in_project_section = False
-        project_name_updated = False
-        for line in settings_content.splitlines():
-            if line.strip() == "[PROJECT]":
-                in_project_section = True
-                updated_lines.append(line)
-            elif in_project_section and line.strip().startswith("NAME"):
-                updated_lines.append(f'NAME = "{project_name}"')
-                project_name_updated = True
-            else:
-                updated_lines.append(line)
-                if line.strip() and in_project_section:
-                    in_project_section = False
+        settings_content = settings_file.read_text(encoding="utf-8")
+        updated_content = set_toml_project_name(settings_content, project_name)
+        if updated_content == settings_content:
+            print(info_message("settings.lcl.toml project name is already up to date."))
+            return
 
-        # [AI]: If NAME wasn't found in the PROJECT section, add it
-        if in_project_section and not project_name_updated:
-            updated_lines.append(f'NAME = "{project_name}"')
+        # [AI]: Make sure the rewrite still parses and carries the new name before touching the file
+        if tomllib is not None and tomllib.loads(updated_content).get("PROJECT", {}).get("NAME") != project_name:
+            raise ValueError("[PROJECT] NAME could not be updated")
 
-        # Write the updated content back to the file
-        with settings_file.open("w") as f:
-            f.write("\n".join(updated_lines))
+        settings_file.write_text(updated_content, encoding="utf-8")
         
         print(info_message(f"Updated settings.lcl.toml with project name: {project_name}"))
     except FileNotFoundError:
@@ -292,6 +485,27 @@ def update_package_json_name():
     except Exception as e:
         print(error_message(f"Error updating settings.lcl.toml: {e}"))
 
+# [AI]: Patterns used to rewrite NAME inside the [PROJECT] table without disturbing comments or other keys
+PROJECT_SECTION_PATTERN = re.compile(r'^\[PROJECT\][ \t]*(?:#.*)?$', re.MULTILINE)
+SECTION_HEADER_PATTERN = re.compile(r'^[ \t]*\[', re.MULTILINE)
+PROJECT_NAME_PATTERN = re.compile(r"""^([ \t]*NAME[ \t]*=[ \t]*)(?:"[^"\n]*"|'[^'\n]*')""", re.MULTILINE)
+
+# [AI]: Set NAME in the [PROJECT] table of a TOML document, adding the key or table if missing
+def set_toml_project_name(content, project_name):
+    header = PROJECT_SECTION_PATTERN.search(content)
+    if header is None:
+        separator = "" if not content or content.endswith("\n") else "\n"
+        return f'{content}{separator}\n[PROJECT]\nNAME = "{project_name}"\n'
+
+    start = header.end()
+    next_header = SECTION_HEADER_PATTERN.search(content, start)
+    end = next_header.start() if next_header else len(content)
+
+    section, count = PROJECT_NAME_PATTERN.subn(lambda m: f'{m.group(1)}"{project_name}"', content[start:end], count=1)
+    if not count:
+        section = f'\nNAME = "{project_name}"{section}'
+    return content[:start] + section + content[end:]
+
 # [AI]: Main function to orchestrate the dependency installation process
 def main():
     try:
@@ -301,36 +515,51 @@ def main():
         print(info_message("Starting dependency installation process..."))
         venv_path = Path.cwd() / "venv"
         
-        requirements_file = find_file("requirements.txt")
-        package_json = find_file("package.json")
+        # [AI]: Resolve npm before any tree walk so a missing toolchain is reported up front
+        npm_path = get_npm_path()
+
+        # [AI]: Locate both manifests in a single walk and hand the paths to the installers
+        paths = find_files({"requirements.txt", "package.json"})
+        requirements_file, package_json = paths.get("requirements.txt"), paths.get("package.json")
         
         if not requirements_file and not package_json:
             print(error_message("Neither requirements.txt nor package.json found in the project directory."))
             return 1
         
         success = True
-        
-        if requirements_file:
-            try:
-                if not install_python_deps(venv_path):
-                    success = False
-            except Exception as e:
-                print(error_message(f"An error occurred during Python dependency installation: {e}"))
-                success = False
-        else:
-            print(warning_message("WARNING:", "requirements.txt not found. Skipping Python dependency installation."))
-        
+
+        # [AI]: Rename the package before the Node.js install starts so it never races the installer
         if package_json:
             try:
-                update_package_json_name()
-                if not install_node_deps():
-                    success = False
+                update_package_json_name(package_json)
             except Exception as e:
-                print(error_message(f"An error occurred during Node.js dependency installation: {e}"))
+                print(error_message(f"An error occurred while updating the project name: {e}"))
                 success = False
-        else:
-            print(warning_message("WARNING:", "package.json not found. Skipping Node.js dependency installation."))
-        
+
+        # [AI]: Python and Node.js installs touch disjoint directories, so run them side by side
+        futures = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if requirements_file:
+                futures["Python"] = executor.submit(install_python_deps, venv_path, requirements_file)
+            else:
+                locked_print(warning_message("WARNING:", "requirements.txt not found. Skipping Python dependency installation."))
+
+            if package_json and not npm_path:
+                locked_print(error_message("Npm is not installed or not accessible."))
+                success = False
+            elif package_json:
+                futures["Node.js"] = executor.submit(install_node_deps, package_json, npm_path)
+            else:
+                locked_print(warning_message("WARNING:", "package.json not found. Skipping Node.js dependency installation."))
+
+            for label, future in futures.items():
+                try:
+                    if not future.result():
+                        success = False
+                except Exception as e:
+                    locked_print(error_message(f"An error occurred during {label} dependency installation: {e}"))
+                    success = False
+
         if success:
             print(success_message("\nAll found dependencies installed successfully."))
             print()  # Add an extra line break here
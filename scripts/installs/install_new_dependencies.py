@@ -7,8 +7,9 @@
 # - Updating of requirements.txt and package.json files
 # - Colored console output for better readability
 # - Logging of installation process
-# - Spinner animation for long-running processes
+# - Shared progress line for long-running processes
 
+import asyncio
 import subprocess
 import sys
 from pathlib import Path
@@ -17,9 +18,12 @@ import json
 import re
 import os
 import shutil
-import threading
 import itertools
-import time
+import collections
+import functools
+import hashlib
+import platform
+import venv
 from colorama import Fore, Style, init
 
 # [AI]: Initialize colorama for cross-platform colored terminal output
@@ -61,6 +65,7 @@ logging.basicConfig(filename='install_dependencies.log', level=logging.INFO,
 logger = logging.getLogger(__name__)
 
 # [AI]: Function to find the root directory of the project
+@functools.lru_cache(maxsize=None)
 def find_project_root():
     current_dir = Path.cwd()
     while current_dir != current_dir.parent:
@@ -72,6 +77,7 @@ def find_project_root():
 PROJECT_ROOT = find_project_root()
 
 # [AI]: Functions to get Python and npm versions
+@functools.lru_cache(maxsize=None)
 def get_python_version():
     try:
         result = subprocess.run([sys.executable, "--version"], check=True, capture_output=True, text=True)
@@ -79,6 +85,7 @@ def get_python_version():
     except subprocess.CalledProcessError:
         return None
 
+@functools.lru_cache(maxsize=None)
 def get_npm_version():
     npm_path = get_npm_path()
     if npm_path:
@@ -108,6 +115,7 @@ def check_python_and_npm():
     return python_version is not None
 
 # [AI]: Function to get the path to the npm executable
+@functools.lru_cache(maxsize=None)
 def get_npm_path():
     npm_cmd = 'npm.cmd' if sys.platform.startswith('win') else 'npm'
     npm_path = shutil.which(npm_cmd)
@@ -118,25 +126,60 @@ def get_npm_path():
 # [AI]: Function to create a virtual environment
 def create_venv(venv_path):
     venv_path = Path(venv_path)
-    if not venv_path.exists():
-        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
-    else:
+    # [AI]: pyvenv.cfg is what marks a directory as a usable venv; a bare directory is not enough
+    if (venv_path / "pyvenv.cfg").exists():
         logger.debug(f"Virtual environment already exists at {venv_path}")
+        return True
+    try:
+        venv.EnvBuilder(system_site_packages=False, with_pip=True,
+                        symlinks=not sys.platform.startswith('win')).create(str(venv_path))
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        # ensurepip still runs as a child process, so its failure surfaces as CalledProcessError
+        logger.error(f"Failed to create virtual environment at {venv_path}: {e}")
+        print(error_message(f"\nFailed to create virtual environment at {venv_path}. See install_dependencies.log for details."))
+        return False
 
 # [AI]: Function to get the path to the Python executable in the virtual environment
 def get_venv_python(venv_path):
     venv_path = Path(venv_path)
     return venv_path / "Scripts" / "python.exe" if sys.platform.startswith('win') else venv_path / "bin" / "python"
 
+# [AI]: Directories never worth descending into when searching for manifests
+SKIP_DIRS = {"node_modules", ".git", "venv", "__pycache__", ".venv", "dist", "build"}
+
+# [AI]: Memoized search results, keyed by (filename, start_dir, max_depth)
+_found_files = {}
+_found_package_json = {}
+
+# [AI]: Breadth-first scandir walk yielding every file named `target` under `root`
+def _iter_matches(root, target, skip=SKIP_DIRS, max_depth=None):
+    queue = collections.deque([(str(root), 0)])
+    while queue:
+        directory, depth = queue.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip and (max_depth is None or depth < max_depth):
+                                queue.append((entry.path, depth + 1))
+                        elif entry.name == target and entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 # [AI]: Function to find a file in the project directory
 def find_file(filename, start_dir=PROJECT_ROOT, max_depth=5):
-    start_dir = Path(start_dir)
-    for root, dirs, files in os.walk(str(start_dir)):
-        if filename in files:
-            return Path(os.path.join(root, filename))
-        if len(Path(root).relative_to(start_dir).parts) >= max_depth:
-            del dirs[:]
-    return None
+    key = (filename, str(start_dir), max_depth)
+    if key not in _found_files:
+        _found_files[key] = next(_iter_matches(start_dir, filename, max_depth=max_depth), None)
+    return _found_files[key]
+
+# [AI]: Pattern marking where a "pip install" or "npm install" group begins
+_SPLIT_RE = re.compile(r'\b(npm|pip)\s+install\b')
 
 # [AI]: Function to get package input from the user
 def get_package_input():
@@ -145,118 +188,250 @@ def get_package_input():
     print(prompt_message("For npm packages, use 'npm install package1 package2 ...'"))
     user_input = input(prompt_message("Packages to install: "))
     packages = []
-    
-    # Split by 'npm install' and 'pip install' to handle both types correctly
-    splits = re.split(r'(npm install|pip install)', user_input)
-    
-    current_type = None
-    for split in splits:
-        split = split.strip()
-        if split == 'npm install':
-            current_type = 'npm'
-        elif split == 'pip install':
-            current_type = 'pip'
-        elif split:
-            if current_type:
-                # Split multiple packages and add them individually
-                for package in split.split():
-                    packages.append((current_type, package))
-            else:
-                # If no type specified, assume they're pip packages
-                for package in split.split():
-                    packages.append(('pip', package))
-    
+
+    # Walk the "pip install"/"npm install" markers once; untagged packages default to pip
+    position = 0
+    current_type = 'pip'
+    for match in _SPLIT_RE.finditer(user_input):
+        packages.extend((current_type, package) for package in user_input[position:match.start()].split())
+        current_type = match.group(1)
+        position = match.end()
+    packages.extend((current_type, package) for package in user_input[position:].split())
+
     return packages
 
-# [AI]: Class to create a spinning animation for long-running processes
-class Spinner:
-    def __init__(self, message=''):
-        self.message = info_message(message)
-        self.spinning = False
-        self.spinner = itertools.cycle(['-', '/', '|', '\\'])
-
-    def spin(self):
-        while self.spinning:
-            sys.stdout.write(f"\r{self.message} {next(self.spinner)}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 2) + '\r')
+# [AI]: Class drawing one shared status line for every in-flight install. It runs as a task on the same
+# event loop as the installs, so no thread or lock is needed to share the task table.
+class ProgressReporter:
+    def __init__(self):
+        self._tasks = {}
+        self._total = 0
+        self._stopped = asyncio.Event()
+        self._spinner = itertools.cycle(['-', '/', '|', '\\'])
+        self._width = 0
+        self._task = None
+
+    def add(self, task_id, label):
+        self._tasks[task_id] = label
+        self._total += 1
+
+    def done(self, task_id):
+        self._tasks.pop(task_id, None)
+
+    def _render(self):
+        if not self._tasks:
+            return
+        foreground = next(iter(self._tasks.values()))
+        active = self._total - len(self._tasks) + 1
+        line = info_message(f"[{active}/{self._total}] {foreground} {next(self._spinner)}")
+        self._width = max(self._width, len(line))
+        sys.stdout.write(f"\r{line.ljust(self._width)}")
         sys.stdout.flush()
 
-    def start(self):
-        self.spinning = True
-        threading.Thread(target=self.spin).start()
+    async def _loop(self):
+        while not self._stopped.is_set():
+            self._render()
+            try:
+                await asyncio.wait_for(self._stopped.wait(), 0.1)
+            except asyncio.TimeoutError:
+                pass
+        sys.stdout.write('\r' + ' ' * self._width + '\r')
+        sys.stdout.flush()
 
-    def stop(self):
-        self.spinning = False
+    def start(self):
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        self._stopped.set()
+        # [AI]: Wait for the line to be cleared so later output never lands behind a progress frame
+        await self._task
+
+# [AI]: On-disk cache of pip installs that already succeeded, so repeating an install with an unchanged
+# requirements.txt only checks the venv instead of running pip's resolver again
+PLAN_CACHE_PATH = Path.home() / ".cache" / "install_new_dependencies" / "plan.json"
+
+# [AI]: Function to normalize a package name the way pip does (PEP 503)
+def canonical_package_name(package):
+    name = re.split(r'[\s\[<>=!~;@]', package, maxsplit=1)[0]
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+# [AI]: Function to build the plan cache key from requirements.txt, the interpreter, and the requested packages
+def plan_cache_key(requirements_path, venv_python, packages):
+    digest = hashlib.blake2b(digest_size=16)
+    if requirements_path and Path(requirements_path).exists():
+        digest.update(Path(requirements_path).read_bytes())
+    for part in (platform.python_version(), sys.platform, str(venv_python), *sorted(packages)):
+        digest.update(b"\0" + part.encode("utf-8"))
+    return digest.hexdigest()
+
+def load_plan_cache():
+    try:
+        return json.loads(PLAN_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
-# [AI]: Function to install a Python package
-def install_python_package(venv_path, package):
+def save_plan_cache(cache):
+    try:
+        PLAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PLAN_CACHE_PATH.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as e:
+        logging.warning(f"Could not write plan cache {PLAN_CACHE_PATH}: {e}")
+
+# [AI]: Function to list the distributions installed in the venv as {canonical name: version}
+def get_installed_distributions(venv_python):
+    script = (
+        "import json, importlib.metadata as m; "
+        "print(json.dumps({d.metadata['Name']: d.version for d in m.distributions() if d.metadata['Name']}))"
+    )
+    try:
+        result = subprocess.run([str(venv_python), "-c", script], capture_output=True, text=True, check=True)
+        return {canonical_package_name(name): version for name, version in json.loads(result.stdout).items()}
+    except (subprocess.CalledProcessError, ValueError) as e:
+        logging.warning(f"Could not list installed distributions: {e}")
+        return {}
+
+# [AI]: Function to tell whether a pip requirement pins a version (or asks for extras, a URL or a marker)
+def _has_version_spec(package):
+    return bool(re.search(r'[<>=!~@;\[]', package))
+
+# [AI]: Function to look up a cached plan; returns the pinned packages still missing from the venv,
+# or None on a cache miss
+def get_cached_plan_missing(requirements_path, venv_python, packages):
+    plan = load_plan_cache().get(plan_cache_key(requirements_path, venv_python, packages))
+    if not plan:
+        return None
+    installed = get_installed_distributions(venv_python)
+    return [f"{name}=={version}" for name, version in plan["pinned"].items() if installed.get(name) != version]
+
+# [AI]: Function to remember the versions a successful install resolved to
+def save_plan(requirements_path, venv_python, packages):
+    installed = get_installed_distributions(venv_python)
+    pinned = {}
+    for package in packages:
+        name = canonical_package_name(package)
+        if name in installed:
+            pinned[name] = installed[name]
+    if len(pinned) < len(packages):
+        return
+    cache = load_plan_cache()
+    cache[plan_cache_key(requirements_path, venv_python, packages)] = {"pinned": pinned}
+    save_plan_cache(cache)
+
+# [AI]: Environment handed to pip and npm: what they need to locate tools, config, caches, credentials,
+# proxies and CA bundles, with pip's version check and interactive prompts turned off
+_BASE_ENV_KEYS = {
+    # Executables and the user's home, config and temp directories
+    "PATH", "PATHEXT", "HOME", "USER", "USERNAME", "LOGNAME", "SHELL", "TERM", "TEMP", "TMP", "TMPDIR",
+    # Windows system and profile locations that npm and node-gyp look up
+    "USERPROFILE", "HOMEDRIVE", "HOMEPATH", "APPDATA", "LOCALAPPDATA", "PROGRAMDATA", "SYSTEMROOT",
+    "SYSTEMDRIVE", "WINDIR", "COMSPEC", "PROGRAMFILES", "PROGRAMFILES(X86)", "PROGRAMW6432",
+    "COMMONPROGRAMFILES", "COMMONPROGRAMFILES(X86)",
+    # Locale
+    "LANG", "LANGUAGE", "LC_ALL", "LC_CTYPE",
+    # Proxies and certificate authorities
+    "HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE",
+    # SSH agent for git+ssh:// requirements
+    "SSH_AUTH_SOCK", "SSH_AGENT_PID",
+}
+_BASE_ENV_PREFIXES = ("PIP_", "npm_config_", "NPM_CONFIG_", "NODE_", "NVM_", "GIT_", "XDG_")
+_BASE_ENV = {key: value for key, value in os.environ.items()
+             if key.upper() in _BASE_ENV_KEYS or key in _BASE_ENV_KEYS or key.startswith(_BASE_ENV_PREFIXES)}
+_BASE_ENV.update({"PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"})
+
+# [AI]: Function to install a batch of Python packages with a single pip invocation
+async def install_python_packages(venv_path, packages, reporter=None):
     venv_python = get_venv_python(venv_path)
-    print()  # Add a line space before the Installing message
-    spinner = Spinner(f'Installing {package}')
-    spinner.start()
+    logging.info(f"Installing {', '.join(packages)} with pip...")
+    if reporter:
+        reporter.add('pip', f"Installing {' '.join(packages)}")
     try:
-        subprocess.run([str(venv_python), "-m", "pip", "install", package], check=True, capture_output=True)
-        spinner.stop()
-        print(success_message(f"\nSuccessfully installed {package}"))
-        return True
-    except subprocess.CalledProcessError as e:
-        spinner.stop()
-        print(error_message(f"\nError installing {package}: {e}"))
+        process = await asyncio.create_subprocess_exec(
+            str(venv_python), "-m", "pip", "install", *packages,
+            stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE, env=_BASE_ENV)
+        _, stderr = await process.communicate()
+        if process.returncode == 0:
+            logging.info(f"Successfully installed {', '.join(packages)}")
+            return True
+        logging.error(f"Failed to install {', '.join(packages)}: {stderr.decode('utf-8', 'replace')}")
         return False
+    except OSError as e:
+        logging.error(f"An error occurred while installing {', '.join(packages)}: {str(e)}")
+        return False
+    finally:
+        # [AI]: The venv just changed, so drop any package listing taken before this install
+        _installed_dist_map.cache_clear()
+        _installed_classifiers.cache_clear()
+        if reporter:
+            reporter.done('pip')
 
 # [AI]: Function to find the package.json file
 def find_package_json():
+    if PROJECT_ROOT in _found_package_json:
+        return _found_package_json[PROJECT_ROOT]
     logging.info("Searching for package.json file...")
-    for root, _, files in os.walk(PROJECT_ROOT):
-        if 'package.json' in files:
-            package_json_path = Path(root) / 'package.json'
-            logging.info(f"Found package.json at: {package_json_path}")
-            return package_json_path
-    logging.warning("No package.json file found in the project.")
-    return None
-
-# [AI]: Function to create a simple spinner animation
-def simple_spinner():
-    spinner = itertools.cycle(['-', '/', '|', '\\'])
-    while True:
-        yield next(spinner)
+    package_json_path = next(_iter_matches(PROJECT_ROOT, 'package.json'), None)
+    if package_json_path:
+        logging.info(f"Found package.json at: {package_json_path}")
+    else:
+        logging.warning("No package.json file found in the project.")
+    _found_package_json[PROJECT_ROOT] = package_json_path
+    return package_json_path
 
-# [AI]: Function to install a Node.js package
-def install_node_package(package_name, package_json_path):
+# [AI]: Function to list the package names package.json already declares, in either dependency section
+def get_declared_node_packages(package_json_path):
+    try:
+        data = json.loads(Path(package_json_path).read_text())
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read {package_json_path}: {e}")
+        return set()
+    return set(data.get('dependencies', {})) | set(data.get('devDependencies', {}))
+
+# [AI]: Function to install a batch of Node.js packages with a single npm invocation
+async def install_node_packages(package_names, package_json_path, reporter=None):
     npm_path = get_npm_path()
     if not npm_path:
-        logging.error("npm not found. Cannot install Node.js package.")
+        logging.error("npm not found. Cannot install Node.js packages.")
         return False
 
     install_dir = package_json_path.parent
-    command = [npm_path, "install", package_name, "--prefix", str(install_dir)]
+    command = [npm_path, "install", *package_names, "--prefix", str(install_dir)]
     
-    logging.info(f"Installing {package_name} in {install_dir}...")
-    spinner = simple_spinner()
+    logging.info(f"Installing {', '.join(package_names)} in {install_dir}...")
+    if reporter:
+        reporter.add('npm', f"Installing {' '.join(package_names)}")
     try:
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        while process.poll() is None:
-            sys.stdout.write(next(spinner))
-            sys.stdout.flush()
-            time.sleep(0.1)
-            sys.stdout.write('\b')
-        stdout, stderr = process.communicate()
-        sys.stdout.write(' \r')
-        sys.stdout.flush()
+        process = await asyncio.create_subprocess_exec(
+            *command, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE, env=_BASE_ENV)
+        _, stderr = await process.communicate()
         if process.returncode == 0:
-            logging.info(f"Successfully installed {package_name}")
+            logging.info(f"Successfully installed {', '.join(package_names)}")
             return True
         else:
-            logging.error(f"Failed to install {package_name}: {stderr}")
+            logging.error(f"Failed to install {', '.join(package_names)}: {stderr.decode('utf-8', 'replace')}")
             return False
     except Exception as e:
-        logging.error(f"An error occurred while installing {package_name}: {str(e)}")
+        logging.error(f"An error occurred while installing {', '.join(package_names)}: {str(e)}")
         return False
+    finally:
+        if reporter:
+            reporter.done('npm')
 
 # [AI]: Function to get the version of an installed Node.js package
 def get_node_package_version(package, package_json_path):
+    # The mtime keeps the cache honest once npm rewrites package.json
+    package_json_path = Path(package_json_path)
+    try:
+        mtime_ns = package_json_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _get_node_package_version(package, str(package_json_path), mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def _get_node_package_version(package, package_json_path, mtime_ns):
+    package_json_path = Path(package_json_path)
     logging.info(f"Determining version for {package}...")
     npm_path = get_npm_path()
     if not npm_path:
@@ -293,183 +468,259 @@ def get_node_package_version(package, package_json_path):
         logging.error(f"Error reading package.json: {str(e)}")
         return None
 
+# [AI]: Function to write JSON crash-safely: the data is synced to a sibling temp file, then swapped in
+def atomic_write_json(path, data):
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with tmp_path.open('w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
+        file.write('\n')
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+# [AI]: Class holding package.json in memory for the whole run so K packages cost one parse and one write
+class PackageJsonCache:
+    def __init__(self):
+        self.path = None
+        self.data = None
+        self._touched = set()
+
+    def load(self, path):
+        self.path = Path(path)
+        self._touched = set()
+        try:
+            self.data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logging.error(f"Error reading {self.path}: {str(e)}")
+            self.data = None
+
+    def add(self, package, version, is_dev):
+        if self.data is None:
+            return False
+        section = 'devDependencies' if is_dev else 'dependencies'
+        target = self.data.setdefault(section, {})
+        if target.get(package) == version:
+            logging.info(f"{package}@{version} is already up to date in {self.path}")
+            return False
+        target[package] = version
+        self._touched.add(section)
+        return True
+
+    def flush(self):
+        if self.data is None or not self._touched:
+            return
+        for section in self._touched:
+            self.data[section] = dict(sorted(self.data[section].items()))
+        try:
+            atomic_write_json(self.path, self.data)
+            self._touched = set()
+            logging.info(f"Successfully wrote {self.path}")
+        except OSError as e:
+            logging.error(f"Error updating {self.path}: {str(e)}")
+
 # [AI]: Function to update package.json with newly installed package
-def update_package_json(package_json_path, package, is_dev):
-    version = get_node_package_version(package, package_json_path)
+def update_package_json(package_json_cache, package, is_dev):
+    version = get_node_package_version(package, package_json_cache.path)
     if not version:
         logging.warning(f"Could not determine version for {package}. package.json may already be up to date.")
         return
 
-    logging.info(f"Updating {package_json_path} with {package}@{version}...")
+    logging.info(f"Updating {package_json_cache.path} with {package}@{version}...")
+    if package_json_cache.add(package, version, is_dev):
+        logging.info(f"Queued {package}@{version} for {package_json_cache.path}")
+
+# [AI]: Name fragments that mark a package as a development dependency, each list compiled to one pattern
+_PY_DEV_RE = re.compile('|'.join(map(re.escape, ['test', 'debug', 'lint', 'format', 'doc', 'build'])))
+_NODE_DEV_RE = re.compile('|'.join(map(re.escape, ['test', 'dev', 'debug', 'lint', 'format', 'doc', 'build', 'eslint', 'prettier', 'jest', 'mocha', 'chai', 'webpack', 'babel', 'typescript'])))
+
+# [AI]: Function to map every distribution in the venv to its version with one `pip list` call
+@functools.lru_cache(maxsize=None)
+def _installed_dist_map(venv_python):
     try:
-        with package_json_path.open('r+') as file:
-            data = json.load(file)
-            
-            # Ensure the required sections exist
-            if 'dependencies' not in data:
-                data['dependencies'] = {}
-            if 'devDependencies' not in data:
-                data['devDependencies'] = {}
-
-            # Determine the target section
-            target = data['devDependencies'] if is_dev else data['dependencies']
-
-            # Update or add the package
-            if package not in target or target[package] != version:
-                target[package] = version
-                
-                # Sort the dependencies alphabetically
-                sorted_deps = dict(sorted(target.items()))
-                if is_dev:
-                    data['devDependencies'] = sorted_deps
-                else:
-                    data['dependencies'] = sorted_deps
-
-                # Write the updated JSON back to the file
-                file.seek(0)
-                json.dump(data, file, indent=2)
-                file.truncate()
-                logging.info(f"Successfully updated {package_json_path} with {package}@{version}")
-            else:
-                logging.info(f"{package}@{version} is already up to date in {package_json_path}")
-    except Exception as e:
-        logging.error(f"Error updating {package_json_path}: {str(e)}")
+        result = subprocess.run([str(venv_python), "-m", "pip", "list", "--format=json"],
+                                capture_output=True, text=True, check=True)
+        return {canonical_package_name(dist["name"]): dist["version"] for dist in json.loads(result.stdout)}
+    except (subprocess.CalledProcessError, ValueError) as e:
+        logging.warning(f"Could not list installed packages: {e}")
+        return {}
+
+# [AI]: Function to map every distribution in the venv to its trove classifiers with one `pip inspect` call
+@functools.lru_cache(maxsize=None)
+def _installed_classifiers(venv_python):
+    try:
+        result = subprocess.run([str(venv_python), "-m", "pip", "inspect"],
+                                capture_output=True, text=True, check=True)
+        return {
+            canonical_package_name(dist["metadata"]["name"]): dist["metadata"].get("classifier", [])
+            for dist in json.loads(result.stdout).get("installed", [])
+        }
+    except (subprocess.CalledProcessError, ValueError, KeyError) as e:
+        logging.warning(f"Could not inspect installed packages: {e}")
+        return {}
 
 # [AI]: Function to determine if a Python package is a development dependency
 def is_dev_dependency(package, venv_python):
-    dev_keywords = ['test', 'debug', 'lint', 'format', 'doc', 'build']
-    if any(keyword in package.lower() for keyword in dev_keywords):
+    if _PY_DEV_RE.search(package.lower()):
         return True
 
-    try:
-        metadata = subprocess.run([str(venv_python), "-m", "pip", "show", package], capture_output=True, text=True).stdout
-        if 'Classifier: Development Status :: 5 - Production/Stable' in metadata:
-            return False
-        if any(f'Classifier: Development Status :: {i}' in metadata for i in range(1, 5)):
-            return True
-    except subprocess.CalledProcessError:
-        pass
+    classifiers = _installed_classifiers(venv_python).get(canonical_package_name(package), [])
+    if 'Development Status :: 5 - Production/Stable' in classifiers:
+        return False
+    if any(f'Development Status :: {i}' in classifier for classifier in classifiers for i in range(1, 5)):
+        return True
 
     return False
 
 # [AI]: Function to determine if a Node.js package is a development dependency
 def is_node_dev_dependency(package):
-    dev_keywords = ['test', 'dev', 'debug', 'lint', 'format', 'doc', 'build', 'eslint', 'prettier', 'jest', 'mocha', 'chai', 'webpack', 'babel', 'typescript']
-    return any(keyword in package.lower() for keyword in dev_keywords)
-
-# [AI]: Function to get the version of an installed Python package
-def get_python_package_version(package_name, venv_python):
-    try:
-        result = subprocess.run([venv_python, '-m', 'pip', 'show', package_name], 
-                                capture_output=True, text=True, check=True)
-        for line in result.stdout.split('\n'):
-            if line.startswith('Version:'):
-                return line.split(':')[1].strip()
-    except subprocess.CalledProcessError:
+    return bool(_NODE_DEV_RE.search(package.lower()))
+
+# [AI]: Pattern splitting a requirement line into its project name and the rest of the specifier
+_REQUIREMENT_NAME_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)(.*)$')
+
+# [AI]: Pattern for the project name and optional extras at the start of a requested package, e.g. "Foo[bar]>=1"
+_REQUIREMENT_PIN_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?')
+
+# [AI]: Function to build the pinned requirements.txt line for a requested package. Any version spec,
+# marker or URL the user typed is replaced by the installed version; their casing and extras are kept.
+def pinned_requirement(package, version):
+    match = _REQUIREMENT_PIN_RE.match(package)
+    if not match:
+        return f"{package.strip()}=={version}"
+    name, extras = match.group(1), match.group(2) or ''
+    extras = re.sub(r'\s+', '', extras)
+    return f"{name}{extras}=={version}"
+
+# [AI]: Function to get the project name of a requirements.txt line, or None for blanks, comments and pip options
+def requirement_name(line):
+    line = line.strip()
+    if not line or line.startswith(('#', '-')):
         return None
-    return None
+    match = _REQUIREMENT_NAME_RE.match(line)
+    return match.group(1) if match else None
+
+# [AI]: Function to check whether a requirements.txt line is a "# ... Dependencies" section header
+def is_section_header(line):
+    line = line.strip()
+    return line.startswith('#') and 'Dependencies' in line
+
+# [AI]: Class holding requirements.txt in memory for the whole run so K packages cost one read and one write.
+# The file is kept as its original lines, so comments, blank lines and ordering survive every rewrite.
+class RequirementsTxtCache:
+    def __init__(self):
+        self.path = None
+        self.lines = None
+        self._dirty = False
+
+    def load(self, path):
+        self.path = Path(path)
+        self._dirty = False
+        try:
+            with open(self.path, 'r') as file:
+                self.lines = file.readlines()
+            logging.info(f"Successfully read {self.path}")
+        except (OSError, ValueError) as e:
+            logging.error(f"Error reading {self.path}: {str(e)}")
+            self.lines = None
+
+    # [AI]: Index range of the lines under a section header, up to the next header or the end of the file
+    def _section_range(self, header):
+        start = next((i for i, line in enumerate(self.lines) if line.strip() == header), None)
+        if start is None:
+            return None
+        end = next((i for i in range(start + 1, len(self.lines)) if is_section_header(self.lines[i])), len(self.lines))
+        return start + 1, end
+
+    def add(self, package, version, is_dev):
+        if self.lines is None:
+            return
+        header = '# Development Dependencies' if is_dev else '# Production Dependencies'
+        new_line = pinned_requirement(package, version) + "\n"
+        name = canonical_package_name(package)
+        section = self._section_range(header)
+
+        # [AI]: An existing entry inside the target section is replaced where it stands
+        matches = [i for i, line in enumerate(self.lines) if canonical_package_name(requirement_name(line) or '') == name]
+        in_place = next((i for i in matches if section and section[0] <= i < section[1]), None)
+        if in_place is not None:
+            logging.info(f"Replacing {self.lines[in_place].strip()} with {new_line.strip()}")
+            self.lines[in_place] = new_line
+
+        # Remove any other entries of the package, whichever section they were in
+        for i in reversed(matches):
+            if i != in_place:
+                logging.info(f"Removed existing entry {self.lines.pop(i).strip()}")
+                if section and i < section[0]:
+                    section = (section[0] - 1, section[1] - 1)
+                elif section and i < section[1]:
+                    section = (section[0], section[1] - 1)
+
+        if in_place is None:
+            logging.info(f"Adding {package} to {header.lstrip('# ')}")
+            if self.lines and not self.lines[-1].endswith('\n'):
+                self.lines[-1] += '\n'
+            if section is None:
+                self.lines.extend([*(['\n'] if self.lines else []), f"{header}\n", new_line])
+            else:
+                # [AI]: Append after the section's last non-blank line so blank separators stay in place
+                insert_at = section[1]
+                while insert_at > section[0] and not self.lines[insert_at - 1].strip():
+                    insert_at -= 1
+                self.lines.insert(insert_at, new_line)
+        self._dirty = True
+
+    def flush(self):
+        if self.lines is None or not self._dirty:
+            return
+        # [AI]: Write beside the target and swap it in, so a crash never leaves a half-written file
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        content = "".join(self.lines)
+        try:
+            with open(tmp_path, 'w') as file:
+                file.write(content)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            logging.info(f"Successfully wrote updated content to {self.path}")
+            logging.debug(f"Contents of {self.path} after update:\n{content}")
+        except OSError as e:
+            logging.error(f"Error updating {self.path}: {str(e)}")
+            logging.exception("Exception details:")
 
 # [AI]: Function to update requirements.txt with newly installed package
-def update_requirements_txt(package, is_dev, venv_python):
+def update_requirements_txt(package, is_dev, venv_python, requirements_cache):
     logging.info(f"Attempting to update requirements.txt for {package}")
     
-    version = get_python_package_version(package, venv_python)
+    version = _installed_dist_map(venv_python).get(canonical_package_name(package))
     if not version:
         logging.error(f"Could not determine version for {package}")
         return
 
     logging.info(f"Determined version for {package}: {version}")
 
-    requirements_path = find_file('requirements.txt')
-    if not requirements_path:
+    if requirements_cache.lines is None:
         logging.error("requirements.txt not found in the project")
         return
 
-    logging.info(f"Found requirements.txt at: {requirements_path}")
-
-    try:
-        with open(requirements_path, 'r') as file:
-            lines = file.readlines()
-        logging.info(f"Successfully read {requirements_path}")
-
-        # Remove any existing entries of the package
-        original_length = len(lines)
-        lines = [line for line in lines if not line.strip().startswith(f"{package}==")]
-        if len(lines) < original_length:
-            logging.info(f"Removed existing entries of {package}")
-        else:
-            logging.info(f"No entries of {package} found to remove")
-
-        # Identify sections
-        prod_start = next((i for i, line in enumerate(lines) if '# Production Dependencies' in line), -1)
-        dev_start = next((i for i, line in enumerate(lines) if '# Development Dependencies' in line), -1)
-        logging.info(f"Production section starts at line {prod_start}, Development section starts at line {dev_start}")
-
-        new_line = f"{package}=={version}\n"
-        
-        if is_dev and dev_start != -1:
-            logging.info(f"Adding {package} to Development Dependencies")
-            insert_index = dev_start + 1
-            while insert_index < len(lines) and lines[insert_index].strip() and not lines[insert_index].startswith('#'):
-                if package < lines[insert_index].split('==')[0]:
-                    break
-                insert_index += 1
-            lines.insert(insert_index, new_line)
-        elif not is_dev and prod_start != -1:
-            logging.info(f"Adding {package} to Production Dependencies")
-            insert_index = prod_start + 1
-            while insert_index < len(lines) and lines[insert_index].strip() and not lines[insert_index].startswith('#'):
-                if package < lines[insert_index].split('==')[0]:
-                    break
-                insert_index += 1
-            lines.insert(insert_index, new_line)
-        else:
-            logging.info(f"Adding new section for {package}")
-            lines.append(f"\n{'# Development' if is_dev else '# Production'} Dependencies\n")
-            lines.append(new_line)
-
-        logging.info(f"Attempting to write updated content to {requirements_path}")
-        with open(requirements_path, 'w') as file:
-            file.writelines(lines)
-        logging.info(f"Successfully wrote updated content to {requirements_path}")
-
-        # Verify the update
-        with open(requirements_path, 'r') as file:
-            updated_content = file.read()
-        if f"{package}=={version}" in updated_content:
-            logging.info(f"Verified: {package}=={version} is now in {requirements_path}")
-        else:
-            logging.error(f"Verification failed: {package}=={version} not found in {requirements_path}")
-
-        logging.debug(f"Contents of {requirements_path} after update:\n{updated_content}")
-    except Exception as e:
-        logging.error(f"Error updating {requirements_path}: {str(e)}")
-        logging.exception("Exception details:")
+    requirements_cache.add(package, version, is_dev)
 
 def find_package_json_files(start_dir=PROJECT_ROOT):
-    start_dir = Path(start_dir)
-    package_json_files = []
-    for root, dirs, files in os.walk(start_dir):
-        if 'package.json' in files:
-            package_json_files.append(Path(root) / 'package.json')
-        if 'node_modules' in dirs:
-            dirs.remove('node_modules')  # don't traverse into node_modules
-    return package_json_files
-
-def update_requirements_for_installed_package(package_name, venv_python):
-    version = get_python_package_version(package_name, venv_python)
+    return list(_iter_matches(start_dir, 'package.json'))
+
+def update_requirements_for_installed_package(package_name, venv_python, requirements_cache):
+    version = _installed_dist_map(venv_python).get(canonical_package_name(package_name))
     if version:
         is_dev = is_dev_dependency(package_name, venv_python)
-        update_requirements_txt(package_name, is_dev, venv_python)
+        update_requirements_txt(package_name, is_dev, venv_python, requirements_cache)
         logger.info(f"Updated requirements.txt for {package_name}")
     else:
         logger.warning(f"Could not find version for {package_name}. It may not be installed.")
 
-def update_package_json_for_installed_package(package_name):
-    version = get_node_package_version(package_name)
+def update_package_json_for_installed_package(package_name, package_json_cache):
+    version = get_node_package_version(package_name, package_json_cache.path)
     if version:
         is_dev = is_node_dev_dependency(package_name)
-        update_package_json(package_name, is_dev)
+        update_package_json(package_json_cache, package_name, is_dev)
         logger.info(f"Updated package.json for {package_name}")
     else:
         logger.warning(f"Could not find version for {package_name}. It may not be installed.")
@@ -477,12 +728,13 @@ def update_package_json_for_installed_package(package_name):
 def display_venv_info(venv_path):
     print(info_message(f"Virtual environment is active at: {venv_path}"))
 
-def main():
+async def main():
     if not check_python_and_npm():
         return 1
 
     venv_path = PROJECT_ROOT / "venv"
-    create_venv(venv_path)
+    if not create_venv(venv_path):
+        return 1
     venv_python = get_venv_python(venv_path)
     display_venv_info(venv_path)
 
@@ -494,30 +746,100 @@ def main():
 
     installed_packages = []
 
-    for prefix, package_name in packages:
-        if prefix == 'npm':
-            package_json_path = find_package_json()
-            if not package_json_path:
-                print(error_message("\nNo package.json found in the project. Cannot install npm package."))
-                continue
-
-            npm_path = get_npm_path()
-            if not npm_path:
-                print(error_message("\nSkipping npm package installation due to missing npm."))
-                continue
-
-            if install_node_package(package_name, package_json_path):
-                update_package_json(package_json_path, package_name, is_node_dev_dependency(package_name))
-                installed_packages.append(f"npm:{package_name}")
-                print(success_message(f"\nSuccessfully installed {package_name}"))
-        elif prefix == 'pip':
-            if install_python_package(venv_path, package_name):
-                is_dev = is_dev_dependency(package_name, venv_python)
-                update_requirements_txt(package_name, is_dev, venv_python)
-                installed_packages.append(f"pip:{package_name}")
-                print(success_message(f"Updated requirements.txt for {package_name}"))
-            else:
-                update_requirements_for_installed_package(package_name, venv_python)
+    # [AI]: Group packages by installer so each tool resolves and installs its batch in one process
+    pip_packages = [package_name for prefix, package_name in packages if prefix == 'pip']
+    npm_packages = [package_name for prefix, package_name in packages if prefix == 'npm']
+
+    # [AI]: Locate both manifests once up front; every update below reuses these paths
+    requirements_path = find_file('requirements.txt')
+    package_json_path = find_package_json() if npm_packages else None
+    requirements_cache = RequirementsTxtCache()
+    if requirements_path:
+        requirements_cache.load(requirements_path)
+    package_json_cache = PackageJsonCache()
+
+    # [AI]: A cached plan for this exact request lets pip be skipped, or limited to what has gone missing
+    requested_pip_packages = pip_packages
+    if pip_packages:
+        missing = get_cached_plan_missing(requirements_path, venv_python, pip_packages)
+        if missing is not None and not missing:
+            print(info_message(f"\n{', '.join(pip_packages)} already installed (cached install plan)."))
+            pip_packages = []
+        elif missing:
+            logging.info(f"Cached install plan found; reinstalling {', '.join(missing)}")
+            pip_packages = missing
+
+    # [AI]: A bare name that is already installed needs no pip run, only its requirements.txt pin
+    skipped_pip_packages = []
+    if pip_packages:
+        installed = _installed_dist_map(venv_python)
+        skipped_pip_packages = [p for p in pip_packages if not _has_version_spec(p) and canonical_package_name(p) in installed]
+        if skipped_pip_packages:
+            logger.info(f"Already installed, skipping pip for: {', '.join(skipped_pip_packages)}")
+            pip_packages = [p for p in pip_packages if p not in skipped_pip_packages]
+
+    if npm_packages:
+        if not package_json_path:
+            print(error_message("\nNo package.json found in the project. Cannot install npm packages."))
+            npm_packages = []
+        elif not get_npm_path():
+            print(error_message("\nSkipping npm package installation due to missing npm."))
+            npm_packages = []
+
+    # [AI]: Likewise for npm names already declared in package.json
+    requested_npm_packages = npm_packages
+    skipped_npm_packages = []
+    if npm_packages:
+        declared = get_declared_node_packages(package_json_path)
+        skipped_npm_packages = [p for p in npm_packages if '@' not in p[1:] and p in declared]
+        if skipped_npm_packages:
+            logger.info(f"Already in package.json, skipping npm for: {', '.join(skipped_npm_packages)}")
+            npm_packages = [p for p in npm_packages if p not in skipped_npm_packages]
+
+    # [AI]: pip and npm work on separate trees and mostly wait on the network, so run both batches at once
+    # under one shared progress line; file updates and console output follow once both have finished
+    messages = []
+    batches = {}
+    print()  # Add a line space before the Installing message
+    reporter = ProgressReporter()
+    reporter.start()
+    try:
+        if pip_packages:
+            batches['pip'] = install_python_packages(venv_path, pip_packages, reporter)
+        if npm_packages:
+            batches['npm'] = install_node_packages(npm_packages, package_json_path, reporter)
+        results = dict(zip(batches, await asyncio.gather(*batches.values())))
+    finally:
+        await reporter.stop()
+
+    if results.get('pip') or ('pip' not in results and skipped_pip_packages):
+        for package_name in requested_pip_packages:
+            is_dev = is_dev_dependency(package_name, venv_python)
+            update_requirements_txt(package_name, is_dev, venv_python, requirements_cache)
+            installed_packages.append(f"pip:{package_name}")
+            messages.append(success_message(f"Updated requirements.txt for {package_name}"))
+        requirements_cache.flush()
+        # [AI]: Keyed on the updated requirements.txt so an identical rerun hits the cache
+        save_plan(requirements_path, venv_python, requested_pip_packages)
+    elif 'pip' in results:
+        messages.append(error_message(f"Error installing {', '.join(pip_packages)}. See install_dependencies.log for details."))
+        for package_name in requested_pip_packages:
+            update_requirements_for_installed_package(package_name, venv_python, requirements_cache)
+        requirements_cache.flush()
+
+    if results.get('npm') or ('npm' not in results and skipped_npm_packages):
+        # [AI]: Loaded only now, after npm has finished rewriting package.json itself
+        package_json_cache.load(package_json_path)
+        for package_name in requested_npm_packages:
+            update_package_json(package_json_cache, package_name, is_node_dev_dependency(package_name))
+            installed_packages.append(f"npm:{package_name}")
+            messages.append(success_message(f"Successfully installed {package_name}"))
+        package_json_cache.flush()
+    elif 'npm' in results:
+        messages.append(error_message(f"Error installing {', '.join(npm_packages)}. See install_dependencies.log for details."))
+
+    for message in messages:
+        print(message)
 
     if installed_packages:
         print(info_message("\nSummary of installed packages:"))  # Changed to info_message
@@ -530,4 +852,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
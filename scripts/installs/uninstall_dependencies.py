@@ -6,19 +6,19 @@
 # - Supports uninstallation of multiple packages in one command
 # - Updates requirements.txt and package.json files
 # - Provides colored console output for better readability
-# - Displays a spinner during package uninstallation
+# - Uninstalls each tool's packages in one batch, with a spinner while it runs
 
 import subprocess
 import sys
 from pathlib import Path
 import logging
 import json
-import re
 import os
+import re
 import shutil
 import threading
 import itertools
-import time
+import functools
 from colorama import Fore, Style, init
 
 # [AI]: Initialize colorama for cross-platform colored terminal output
@@ -88,6 +88,7 @@ def check_python_and_npm():
     return python_version is not None
 
 # [AI]: Function to get Python version
+@functools.lru_cache(maxsize=1)
 def get_python_version():
     try:
         result = subprocess.run([sys.executable, "--version"], check=True, capture_output=True, text=True)
@@ -96,6 +97,7 @@ def get_python_version():
         return None
 
 # [AI]: Function to get npm version
+@functools.lru_cache(maxsize=1)
 def get_npm_version():
     npm_path = get_npm_path()
     if npm_path:
@@ -107,6 +109,7 @@ def get_npm_version():
     return None
 
 # [AI]: Function to get npm executable path
+@functools.lru_cache(maxsize=1)
 def get_npm_path():
     npm_cmd = 'npm.cmd' if sys.platform.startswith('win') else 'npm'
     npm_path = shutil.which(npm_cmd)
@@ -119,12 +122,33 @@ def get_venv_python(venv_path):
     venv_path = Path(venv_path)
     return venv_path / "Scripts" / "python.exe" if sys.platform.startswith('win') else venv_path / "bin" / "python"
 
-# [AI]: Function to find a file in the project directory
+# [AI]: Resolved once per run and shared by every uninstall
+NPM_PATH = get_npm_path()
+VENV_PYTHON = get_venv_python(PROJECT_ROOT / "venv")
+
+# [AI]: Directories that never hold the project's own manifests and are expensive to walk
+_SKIP = {'node_modules', 'venv', '.git', '.next', '__pycache__', 'dist', 'build'}
+
+# [AI]: Function to yield every file under root, pruning the _SKIP directories
+def _walk(root):
+    stack = [Path(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            for entry in directory.iterdir():
+                if entry.is_dir() and not entry.is_symlink():
+                    if entry.name not in _SKIP:
+                        stack.append(entry)
+                else:
+                    yield entry
+        except OSError:
+            pass
+
+# [AI]: Function to find a file in the project directory; the first match is remembered for the run
+@functools.lru_cache(maxsize=None)
 def find_file(filename, start_path='.'):
-    for root, dirs, files in os.walk(start_path):
-        if filename in files:
-            return os.path.join(root, filename)
-    return None
+    match = next((entry for entry in _walk(start_path) if entry.name == filename), None)
+    return str(match) if match else None
 
 # [AI]: Function to get user input for package uninstallation
 def get_package_input():
@@ -132,147 +156,204 @@ def get_package_input():
     print(prompt_message("For pip packages, use 'pip uninstall package1 package2 ...'"))
     print(prompt_message("For npm packages, use 'npm uninstall package1 package2 ...'"))
     user_input = input(prompt_message("Packages to uninstall: "))
-    packages = []
-    
-    splits = re.split(r'(npm uninstall|pip uninstall)', user_input)
-    
-    current_type = None
-    for split in splits:
-        split = split.strip()
-        if split == 'npm uninstall':
-            current_type = 'npm'
-        elif split == 'pip uninstall':
-            current_type = 'pip'
-        elif split:
-            if current_type:
-                # Split the package names if there are multiple
-                for package in split.split():
-                    packages.append((current_type, package))
-            else:
-                # If no type specified, assume it's a pip package
-                packages.append(('pip', split))
-    
-    return packages
-
-# [AI]: Spinner class for displaying progress during package uninstallation
-class Spinner:
-    def __init__(self, message=''):
-        self.message = info_message(message)
-        self.spinning = False
-        self.spinner = itertools.cycle(['-', '/', '|', '\\'])
-
-    def spin(self):
-        while self.spinning:
-            sys.stdout.write(f"\r{self.message} {next(self.spinner)}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 2) + '\r')
-        sys.stdout.flush()
-
-    def start(self):
-        self.spinning = True
-        threading.Thread(target=self.spin).start()
-
-    def stop(self):
-        self.spinning = False
-
-# [AI]: Function to uninstall a Python package
-def uninstall_python_package(venv_path, package):
-    venv_python = get_venv_python(venv_path)
-    print()  # Add a line space before the Uninstalling message
-    spinner = Spinner(f'Uninstalling {package}')
-    spinner.start()
+    tokens = user_input.split()
+    pip_packages = []
+    npm_packages = []
+
+    # Single left-to-right scan: "pip uninstall" / "npm uninstall" switch the target list,
+    # anything before the first marker is assumed to be a pip package
+    current_packages = pip_packages
+    i = 0
+    while i < len(tokens):
+        if i + 1 < len(tokens) and tokens[i + 1] == 'uninstall' and tokens[i] in ('pip', 'npm'):
+            current_packages = pip_packages if tokens[i] == 'pip' else npm_packages
+            i += 2
+            continue
+        current_packages.append(tokens[i])
+        i += 1
+
+    return pip_packages, npm_packages
+
+# [AI]: Serialize terminal writes between the spinner thread and the main thread
+_STDOUT_LOCK = threading.Lock()
+
+def locked_print(*args, **kwargs):
+    with _STDOUT_LOCK:
+        print(*args, **kwargs)
+
+# [AI]: One long-lived spinner thread for the whole run; each uninstall batch only toggles it on and off
+class SpinnerService:
+    def __init__(self):
+        self.message = ''
+        self._width = 0
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._shutdown = threading.Event()
+        self._wake = threading.Event()
+        self._spinner = itertools.cycle(['-', '/', '|', '\\'])
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._shutdown.is_set():
+            # The frame is drawn under the lock so end() can never clear the line mid-frame
+            with self._lock:
+                if self._active.is_set():
+                    with _STDOUT_LOCK:
+                        sys.stdout.write(f"\r{self.message} {next(self._spinner)}")
+                        sys.stdout.flush()
+            # 80 ms between frames while active, no wake-ups at all while idle; begin(), end() and
+            # shutdown() set _wake so the thread reacts at once instead of finishing a sleep
+            self._wake.wait(0.08 if self._active.is_set() else None)
+            self._wake.clear()
+
+    def begin(self, message):
+        with self._lock:
+            self.message = info_message(message)
+            self._width = len(self.message) + 2
+            self._active.set()
+        self._wake.set()
+
+    def end(self):
+        with self._lock:
+            if not self._active.is_set():
+                return
+            self._active.clear()
+            with _STDOUT_LOCK:
+                sys.stdout.write('\r' + ' ' * self._width + '\r')
+                sys.stdout.flush()
+        self._wake.set()
+
+    def shutdown(self):
+        self.end()
+        self._shutdown.set()
+        self._wake.set()
+        # [AI]: Join so nothing can be written to the terminal after the final output
+        self._thread.join()
+
+SPINNER = SpinnerService()
+
+# [AI]: Function to uninstall a batch of Python packages with a single pip invocation
+def uninstall_python_packages(venv_python, packages):
+    locked_print()  # Add a line space before the Uninstalling message
+    SPINNER.begin(f"Uninstalling {len(packages)} pip package{'s' if len(packages) != 1 else ''}")
     try:
-        subprocess.run([str(venv_python), "-m", "pip", "uninstall", "-y", package], check=True, capture_output=True)
-        spinner.stop()
-        print(success_message(f"\nSuccessfully uninstalled {package}"))
+        subprocess.run([str(venv_python), "-m", "pip", "uninstall", "-y", *packages], check=True, capture_output=True)
+        SPINNER.end()
+        locked_print(success_message(f"\nSuccessfully uninstalled {', '.join(packages)}"))
         return True
     except subprocess.CalledProcessError as e:
-        spinner.stop()
-        print(error_message(f"\nError uninstalling {package}: {e}"))
+        SPINNER.end()
+        locked_print(error_message(f"\nError uninstalling {', '.join(packages)}: {e}"))
         return False
 
-# [AI]: Function to uninstall a Node.js package
-def uninstall_node_package(package, package_json_path):
-    npm_path = get_npm_path()
+# [AI]: Function to uninstall a batch of Node.js packages with a single npm invocation
+def uninstall_node_packages(packages, package_json_path):
+    npm_path = NPM_PATH
     if not npm_path:
-        print(error_message("\nnpm is not installed or not accessible. Cannot uninstall Node packages."))
+        locked_print(error_message("\nnpm is not installed or not accessible. Cannot uninstall Node packages."))
         return False
 
     install_dir = package_json_path.parent
-    print()  # Add a line space before the Uninstalling message
-    spinner = Spinner(f'Uninstalling {package}')
-    spinner.start()
+    locked_print()  # Add a line space before the Uninstalling message
+    SPINNER.begin(f"Uninstalling {len(packages)} npm package{'s' if len(packages) != 1 else ''}")
     try:
-        subprocess.run([npm_path, "uninstall", package, "--prefix", str(install_dir)], check=True, capture_output=True)
-        spinner.stop()
-        print(success_message(f"\nSuccessfully uninstalled {package}"))
+        subprocess.run([npm_path, "uninstall", *packages, "--prefix", str(install_dir)], check=True, capture_output=True)
+        SPINNER.end()
+        locked_print(success_message(f"\nSuccessfully uninstalled {', '.join(packages)}"))
         return True
     except subprocess.CalledProcessError as e:
-        spinner.stop()
-        print(error_message(f"\nError uninstalling {package}: {e}"))
+        SPINNER.end()
+        locked_print(error_message(f"\nError uninstalling {', '.join(packages)}: {e}"))
         return False
 
-# [AI]: Function to update requirements.txt after uninstalling a Python package
-def update_requirements_txt(package):
-    requirements_path = find_file('requirements.txt')
+# [AI]: Function to replace a file crash-safely: write and fsync a sibling temp file, then rename it over the target
+def atomic_write_text(path, text):
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', buffering=64 * 1024) as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+# [AI]: Located once per run; every requirements.txt update reuses this path. The project root is
+# checked directly, and the tree under it is walked only if requirements.txt lives deeper.
+REQUIREMENTS_PATH = PROJECT_ROOT / 'requirements.txt'
+if not REQUIREMENTS_PATH.is_file():
+    found_requirements = find_file('requirements.txt', str(PROJECT_ROOT))
+    REQUIREMENTS_PATH = Path(found_requirements) if found_requirements else None
+
+# [AI]: Pattern matching the project name at the start of a requirements.txt line
+_REQUIREMENT_NAME_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9._-]*')
+
+# [AI]: Function to normalize a distribution name the way pip does (PEP 503), so Foo_Bar matches foo-bar
+def canonical_package_name(name):
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+# [AI]: Function to get the canonical project name of a requirements.txt line, or None for blanks, comments and options
+def requirement_name(line):
+    match = _REQUIREMENT_NAME_RE.match(line.strip())
+    return canonical_package_name(match.group()) if match else None
+
+# [AI]: Function to update requirements.txt after uninstalling a batch of Python packages
+def update_requirements_txt(packages):
+    requirements_path = REQUIREMENTS_PATH
     if not requirements_path:
         print(error_message("\nrequirements.txt not found in the project"))
         return
 
     try:
-        with open(requirements_path, 'r') as file:
+        with open(requirements_path, 'r', encoding='utf-8') as file:
             lines = file.readlines()
 
-        # Remove the package from requirements.txt
-        lines = [line for line in lines if not line.strip().startswith(f"{package}==")]
+        # Remove every uninstalled package from requirements.txt in one pass
+        package_set = {canonical_package_name(package) for package in packages}
+        lines = [line for line in lines if requirement_name(line) not in package_set]
 
-        with open(requirements_path, 'w') as file:
-            file.writelines(lines)
+        atomic_write_text(requirements_path, ''.join(lines))
 
-        print(success_message(f"Removed {package} from {file_path_message(requirements_path)}"))
+        print(success_message(f"Removed {', '.join(packages)} from {file_path_message(str(requirements_path))}"))
     except Exception as e:
         print(error_message(f"Error updating {requirements_path}: {str(e)}"))
 
-# [AI]: Function to update package.json after uninstalling a Node.js package
-def update_package_json(package_json_path, package):
+# [AI]: Function to update package.json after uninstalling a batch of Node.js packages
+def update_package_json(package_json_path, packages):
     try:
-        with package_json_path.open('r+') as file:
+        with package_json_path.open('r', encoding='utf-8') as file:
             data = json.load(file)
-            
-            # Remove the package from dependencies and devDependencies
-            if 'dependencies' in data and package in data['dependencies']:
-                del data['dependencies'][package]
-            if 'devDependencies' in data and package in data['devDependencies']:
-                del data['devDependencies'][package]
-
-            # Write the updated JSON back to the file
-            file.seek(0)
-            json.dump(data, file, indent=2)
-            file.truncate()
-
-        print(success_message(f"Removed {package} from {file_path_message(package_json_path)}"))
+
+        # Remove every package from dependencies and devDependencies
+        for package in packages:
+            data.get('dependencies', {}).pop(package, None)
+            data.get('devDependencies', {}).pop(package, None)
+
+        # Write the updated JSON back to the file once for the whole batch
+        atomic_write_text(package_json_path, json.dumps(data, indent=2))
+
+        print(success_message(f"Removed {', '.join(packages)} from {file_path_message(str(package_json_path))}"))
     except Exception as e:
         print(error_message(f"Error updating {package_json_path}: {str(e)}"))
 
 # [AI]: Function to find package.json file in the project
+@functools.lru_cache(maxsize=None)
 def find_package_json():
-    for root, _, files in os.walk(PROJECT_ROOT):
-        if 'package.json' in files:
-            return Path(root) / 'package.json'
-    return None
+    return next((entry for entry in _walk(PROJECT_ROOT) if entry.name == 'package.json'), None)
 
 # [AI]: Main function to orchestrate the uninstallation process
 def main():
     if not check_python_and_npm():
         return 1
 
-    venv_path = PROJECT_ROOT / "venv"
-    venv_python = get_venv_python(venv_path)
+    venv_python = VENV_PYTHON
+    # [AI]: One stat up front instead of a failed exec later; without a venv, uninstall from this interpreter
+    if not venv_python.is_file():
+        print(warning_message("\nWARNING:", f"venv not found, using {sys.executable}"))
+        venv_python = Path(sys.executable)
 
-    packages = get_package_input()
+    pip_packages, npm_packages = get_package_input()
     
-    if not packages:
+    if not pip_packages and not npm_packages:
         print(warning_message("\nWARNING:", "No packages entered. Nothing to uninstall."))
         return 0
 
@@ -282,20 +363,20 @@ def main():
     if not package_json_path:
         print(error_message("\nNo package.json found in the project. Cannot uninstall npm packages."))
     
-    npm_path = get_npm_path()
+    npm_path = NPM_PATH
     if not npm_path:
         print(error_message("\nnpm is not installed or not accessible. Cannot uninstall npm packages."))
 
-    for prefix, package_name in packages:
-        if prefix == 'npm':
-            if package_json_path and npm_path:
-                if uninstall_node_package(package_name, package_json_path):
-                    update_package_json(package_json_path, package_name)
-                    uninstalled_packages.append(f"npm:{package_name}")
-        elif prefix == 'pip':
-            if uninstall_python_package(venv_path, package_name):
-                update_requirements_txt(package_name)
-                uninstalled_packages.append(f"pip:{package_name}")
+    # [AI]: Each tool gets one process for its whole batch instead of one per package
+    if npm_packages and package_json_path and npm_path:
+        if uninstall_node_packages(npm_packages, package_json_path):
+            update_package_json(package_json_path, npm_packages)
+            uninstalled_packages.extend(f"npm:{package_name}" for package_name in npm_packages)
+
+    if pip_packages:
+        if uninstall_python_packages(venv_python, pip_packages):
+            update_requirements_txt(pip_packages)
+            uninstalled_packages.extend(f"pip:{package_name}" for package_name in pip_packages)
 
     if uninstalled_packages:
         print(info_message("\nSummary of uninstalled packages:"))
@@ -308,4 +389,7 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    try:
+        sys.exit(main())
+    finally:
+        SPINNER.shutdown()
\ No newline at end of file
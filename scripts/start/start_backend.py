@@ -10,9 +10,10 @@
 import sys
 from pathlib import Path
 import logging
-import uvicorn
 import webbrowser
 import time
+import socket
+from urllib.parse import urlsplit
 from threading import Thread
 import argparse
 import subprocess
@@ -24,8 +25,6 @@ backend_dir = project_root / "backend"
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(backend_dir))
 
-from backend.app.config import settings
-
 # [AI]: Initialize colorama for cross-platform colored console output
 init(autoreset=True)
 
@@ -43,13 +42,23 @@ def print_warning(message):
 logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-# [AI]: Reduce watchfiles logging output in debug mode to minimize console clutter
-if settings.ENV['DEBUG']:
-    logging.getLogger("watchfiles").setLevel(logging.ERROR)
+# [AI]: Function to wait until the server accepts TCP connections, giving up after `timeout` seconds
+def wait_for_server(url, timeout=10):
+    parsed = urlsplit(url)
+    # A wildcard bind address is not connectable everywhere, so probe loopback instead
+    host = '127.0.0.1' if parsed.hostname in ('0.0.0.0', '', None) else parsed.hostname
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, parsed.port or 80), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
 
 # [AI]: Function to open the application in a browser
 def open_browser(url, browser_name=None):
-    time.sleep(2)  # [AI]: Short delay to ensure server is ready
+    wait_for_server(url)  # [AI]: Open as soon as the server is up, or after 10 s at the latest
     if browser_name:
         try:
             browser = webbrowser.get(browser_name)
@@ -65,21 +74,20 @@ def open_browser(url, browser_name=None):
     # [AI]: Use default system browser if Edge is not available
     webbrowser.open(url)
 
+# [AI]: The one Edge launch command that can work on this platform
+_EDGE_COMMAND = {
+    'win32': 'start microsoft-edge:{url}',
+    'darwin': 'open -a "Microsoft Edge" {url}',
+}.get(sys.platform, 'microsoft-edge {url}')
+
 # [AI]: Function to attempt opening Microsoft Edge browser
 def open_edge(url):
-    edge_commands = [
-        f'start microsoft-edge:{url}',
-        f'open -a "Microsoft Edge" {url}',
-        f'microsoft-edge {url}'
-    ]
-    
-    for cmd in edge_commands:
-        try:
-            subprocess.run(cmd, shell=True, check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            continue
-    return False
+    # [AI]: Launch without waiting for the browser; a command that is still running, or exited
+    # cleanly, after a short grace period counts as success
+    process = subprocess.Popen(_EDGE_COMMAND.format(url=url), shell=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.05)
+    return process.poll() in (None, 0)
 
 def main():
     # [AI]: Parse command-line arguments for browser selection
@@ -87,6 +95,14 @@ def main():
     parser.add_argument('--browser', help="Specify the browser to open")
     args = parser.parse_args()
 
+    # [AI]: Imported only now so --help and argument errors return without loading uvicorn or the backend app
+    import uvicorn
+    from backend.app.config import settings
+
+    # [AI]: Reduce watchfiles logging output in debug mode to minimize console clutter
+    if settings.ENV['DEBUG']:
+        logging.getLogger("watchfiles").setLevel(logging.ERROR)
+
     print()  # [AI]: Add one line space after the command line for better readability
     # Ensure APP is accessed correctly
     print_info(f"Starting {settings.PROJECT['NAME']} backend server ({settings.ENV['APP_ENV']})")  # Change to dictionary access
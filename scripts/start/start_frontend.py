@@ -12,13 +12,12 @@ from pathlib import Path
 import logging
 import subprocess
 import os
+import socket
 import time
 from threading import Thread
 import argparse
 import webbrowser
 from colorama import Fore, Style, init
-import requests
-import json
 
 # [AI]: Add the project root to the Python path to allow imports from other project modules
 project_root = Path(__file__).resolve().parents[2]
@@ -92,22 +91,23 @@ def run_server():
     finally:
         print_info("Server shutdown complete.")
 
+# [AI]: The one Edge launch command that can work on this platform
+_EDGE_COMMAND = {
+    'win32': 'start microsoft-edge:{url}',
+    'darwin': 'open -a "Microsoft Edge" {url}',
+}.get(sys.platform, 'microsoft-edge {url}')
+
 # [AI]: Function to open Microsoft Edge browser
 def open_edge():
     url = 'http://localhost:3000'
-    edge_commands = [
-        'start microsoft-edge:' + url,  # Windows
-        'open -a "Microsoft Edge" ' + url,  # macOS
-        'microsoft-edge ' + url  # Linux
-    ]
-    
-    for cmd in edge_commands:
-        try:
-            subprocess.Popen(cmd, shell=True)
-            return True
-        except:
-            continue
-    return False
+    try:
+        process = subprocess.Popen(_EDGE_COMMAND.format(url=url), shell=True,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    # A shell that exits non-zero right away means Edge is not installed here
+    time.sleep(0.05)
+    return process.poll() in (None, 0)
 
 # [AI]: Function to open a web browser, with preference for Microsoft Edge
 def open_browser(browser_name=None):
@@ -140,15 +140,15 @@ def open_browser(browser_name=None):
     # If all else fails, use the default browser
     webbrowser.open(url)
 
-# [AI]: Function to wait for the server to be ready
+# [AI]: Function to wait for the server to be ready; a TCP connect is all a liveness check needs
 def wait_for_server(timeout=30):
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
-            requests.get('http://localhost:3000', timeout=1)
-            return True
-        except requests.RequestException:
-            time.sleep(0.5)
+            with socket.create_connection(('localhost', 3000), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.1)
     return False
 
 # [AI]: Main function to orchestrate the server startup process
@@ -175,13 +175,12 @@ def main():
     
     print()
 
-    # [AI]: Keep the main thread alive and handle graceful shutdown
+    # [AI]: Block on the server thread itself rather than waking every second; Ctrl+C still lands here
     try:
-        while True:
-            time.sleep(1)
+        server_thread.join()
     except KeyboardInterrupt:
         print_info("Server stopping...")
-    finally:
+        # npm received the same Ctrl+C, so wait for it to finish shutting down
         server_thread.join()
 
 if __name__ == "__main__":
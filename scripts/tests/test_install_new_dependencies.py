@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "installs"))
+
+import install_new_dependencies as deps
+
+
+def _add(tmp_path, content, package, version, is_dev=False):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text(content)
+    cache = deps.RequirementsTxtCache()
+    cache.load(requirements)
+    cache.add(package, version, is_dev)
+    cache.flush()
+    return requirements.read_text()
+
+
+def test_pinned_requirement_replaces_user_spec():
+    assert deps.pinned_requirement("requests>=2", "2.31.0") == "requests==2.31.0"
+    assert deps.pinned_requirement("requests==2.31.0", "2.31.0") == "requests==2.31.0"
+    assert deps.pinned_requirement("Foo_Bar[a, b]~=1.0", "1.2") == "Foo_Bar[a,b]==1.2"
+
+
+def test_add_with_minimum_version_spec(tmp_path):
+    content = "# Production Dependencies\nfastapi==0.110.0\n"
+    result = _add(tmp_path, content, "requests>=2", "2.31.0")
+    assert result == "# Production Dependencies\nfastapi==0.110.0\nrequests==2.31.0\n"
+
+
+def test_add_with_exact_version_spec_replaces_existing_pin(tmp_path):
+    content = "# Production Dependencies\nrequests==2.0.0\nfastapi==0.110.0\n"
+    result = _add(tmp_path, content, "requests==2.31.0", "2.31.0")
+    assert result == "# Production Dependencies\nrequests==2.31.0\nfastapi==0.110.0\n"
@@ -1,5 +1,5 @@
 # [AI]: This file implements an automated update process for multiple project-related scripts.
-# It provides functionality to run a series of update scripts sequentially.
+# It provides functionality to run a series of update scripts, side by side where they are independent.
 # Key features:
 # - Colored console output for better readability
 # - Error handling and logging for each script execution
@@ -7,10 +7,12 @@
 
 import subprocess
 import sys
+import threading
 from pathlib import Path
 import logging
 from colorama import Fore, Style, init
-from typing import List
+from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # [AI]: Initialize colorama for cross-platform colored terminal output
 init(autoreset=True)
@@ -46,45 +48,87 @@ def file_path_message(message: str) -> str:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# [AI]: Function to run an individual update script
+# [AI]: Scripts that write separate files and can run side by side
+INDEPENDENT_SCRIPTS: List[str] = [
+    "update_api_specs.py",
+    "update_project_tree.py",
+    "update_tech_stack.py"
+]
+
+# [AI]: Scripts that must run on their own, after the independent ones, in this order
+SEQUENTIAL_SCRIPTS: List[str] = [
+    "update_database_schema.py"
+]
+
+# [AI]: Function to print the outcome and captured output of a finished update script
+def report_result(script_name: str, returncode: int, stdout: str, stderr: str) -> None:
+    if returncode == 0:
+        print(success_message(f"Successfully ran {script_name}"))
+        if stdout:
+            print(info_message(f"Output from {script_name}:"))
+            print(file_path_message(stdout.strip()))
+        return
+
+    # [AI]: Handle and display any errors that occur during script execution
+    print(error_message(f"Error running {script_name}: exit status {returncode}"))
+    if stdout:
+        print(info_message(f"Output from {script_name}:"))
+        print(file_path_message(stdout.strip()))
+    if stderr:
+        print(error_message(f"Error output from {script_name}:"))
+        print(file_path_message(stderr.strip()))
+
+# [AI]: Function to run one update script to completion and return its exit status and output
+def capture_script(script_name: str) -> Tuple[int, str, str]:
+    script_path = Path(__file__).parent / script_name
+    process = subprocess.Popen(
+        [sys.executable, str(script_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    stdout, stderr = process.communicate()
+    return process.returncode, stdout, stderr
+
+# [AI]: Function to run an individual update script, forwarding its output line by line as it is produced.
+# The child runs unbuffered ("-u") so its lines arrive as they are printed rather than when it exits.
 def run_script(script_name: str) -> None:
     script_path = Path(__file__).parent / script_name
     print(info_message(f"Running {script_name}..."))
-    try:
-        # [AI]: Execute the script as a subprocess and capture its output
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        print(success_message(f"Successfully ran {script_name}"))
-        if result.stdout:
-            print(info_message(f"Output from {script_name}:"))
-            print(file_path_message(result.stdout.strip()))
-    except subprocess.CalledProcessError as e:
-        # [AI]: Handle and display any errors that occur during script execution
-        print(error_message(f"Error running {script_name}: {e}"))
-        if e.stdout:
-            print(info_message(f"Output from {script_name}:"))
-            print(file_path_message(e.stdout.strip()))
-        if e.stderr:
-            print(error_message(f"Error output from {script_name}:"))
-            print(file_path_message(e.stderr.strip()))
+    process = subprocess.Popen(
+        [sys.executable, "-u", str(script_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    # [AI]: stderr is drained on its own thread so neither pipe can fill up and stall the child;
+    # it is reported through report_result, in the error colour, if the script fails
+    stderr_chunks: List[str] = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    stderr_reader.start()
+    for line in process.stdout:
+        sys.stdout.write(file_path_message(line.rstrip('\n')) + '\n')
+    process.stdout.close()
+    returncode = process.wait()
+    stderr_reader.join()
+    process.stderr.close()
+    # [AI]: The standard output has already been shown, so only the outcome and any errors are left to report
+    report_result(script_name, returncode, "", "".join(stderr_chunks))
 
 # [AI]: Main function to orchestrate the execution of all update scripts
 def main() -> None:
     print(info_message("\nStarting update_all.py\n"))
-    # [AI]: List of update scripts to be executed
-    scripts: List[str] = [
-        "update_api_specs.py",
-        "update_database_schema.py",
-        "update_project_tree.py",
-        "update_tech_stack.py"
-    ]
-
-    # [AI]: Execute each script in the list sequentially
-    for script in scripts:
+
+    # [AI]: Start the independent scripts together; each one's output is printed whole as it finishes,
+    # so the scripts never interleave on the console
+    print(info_message(f"Running {', '.join(INDEPENDENT_SCRIPTS)}..."))
+    with ThreadPoolExecutor(max_workers=len(INDEPENDENT_SCRIPTS)) as executor:
+        futures = {executor.submit(capture_script, script): script for script in INDEPENDENT_SCRIPTS}
+        for future in as_completed(futures):
+            report_result(futures[future], *future.result())
+
+    for script in SEQUENTIAL_SCRIPTS:
         run_script(script)
     
     print(success_message("\nAll update scripts have been executed."))
@@ -8,15 +8,33 @@
 # - Handles errors and provides informative messages
 
 import os
+import functools
 from pathlib import Path
 import logging
 import sys
 import importlib.util
 import json
-from fastapi import FastAPI
-from fastapi.openapi.utils import get_openapi
+import hashlib
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional
 from colorama import Fore, Style, init
 
+# [AI]: fastapi is only needed once the app is loaded, so it is imported inside the functions that use it
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+# [AI]: orjson is optional; it serializes the schema blocks much faster than the stdlib json module.
+# The fallback writes non-ASCII characters as-is, with the same indent and separators, so the generated
+# api_specs.md is the same whichever serializer is installed.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False, separators=(",", ": "))
+
 # [AI]: Initialize colorama for cross-platform colored terminal output
 init(autoreset=True)
 
@@ -51,7 +69,8 @@ def file_path_message(message: str) -> str:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# [AI]: Function to find the project root directory
+# [AI]: Function to find the project root directory, memoized per start path
+@functools.lru_cache(maxsize=None)
 def find_project_root(start_path: Path) -> Path:
     current_path = start_path.resolve()
     while current_path != current_path.parent:
@@ -60,85 +79,162 @@ def find_project_root(start_path: Path) -> Path:
         current_path = current_path.parent
     raise FileNotFoundError("Could not find project root. Make sure you're in a git repository or have a pyproject.toml file.")
 
-# [AI]: Function to dynamically import the FastAPI app
-def import_app(file_path: Path) -> FastAPI:
-    parent_dir = file_path.parent.parent.parent
-    sys.path.append(str(parent_dir))
+# [AI]: Context manager that puts paths at the front of sys.path for the duration of the block and
+# removes them again afterwards; paths that were already on sys.path are left alone
+@contextmanager
+def _inject_paths(*paths):
+    added = [p for p in dict.fromkeys(paths) if p not in sys.path]
+    sys.path[:0] = added
+    try:
+        yield
+    finally:
+        for p in added:
+            sys.path.remove(p)
+
+# [AI]: Function to dynamically import the FastAPI app with the project root and backend directory importable
+def import_app(file_path: Path) -> "FastAPI":
+    root_dir = file_path.parent.parent.parent
+    backend_dir = file_path.parent.parent
     spec = importlib.util.spec_from_file_location("main", file_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
+    with _inject_paths(str(root_dir), str(backend_dir)):
+        spec.loader.exec_module(module)
     return module.app
 
-# [AI]: Function to generate API documentation in Markdown format
-def generate_api_docs(app: FastAPI) -> str:
-    # [AI]: Get the OpenAPI schema from the FastAPI app
-    openapi_schema = get_openapi(
+# [AI]: Directory holding OpenAPI schemas from earlier runs, one file per source fingerprint
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "api_specs"
+
+# [AI]: Directories under the backend that never hold route or model sources
+_SOURCE_SKIP_DIRS = {"__pycache__", "venv", ".venv", "node_modules"}
+
+# [AI]: Function to fingerprint everything the schema is generated from: the app's identity, the fastapi
+# version and the path, size and mtime of every Python source under the backend
+def schema_cache_key(app: "FastAPI", source_dir: Path) -> str:
+    import fastapi
+    digest = hashlib.sha256()
+    for part in (app.title, app.version, app.description or "", fastapi.__version__):
+        digest.update(part.encode("utf-8") + b"\0")
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _SOURCE_SKIP_DIRS)
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                digest.update(f"{os.path.relpath(path, source_dir)}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+# [AI]: Function to get the OpenAPI schema for an app. With a source_dir, the schema is reused from the
+# on-disk cache while none of the backend sources have changed, and stored there after generating it.
+def get_openapi_schema(app: "FastAPI", source_dir: Optional[Path] = None) -> dict:
+    cache_path = SCHEMA_CACHE_DIR / f"openapi-{schema_cache_key(app, source_dir)}.json" if source_dir else None
+    if cache_path is not None:
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    from fastapi.openapi.utils import get_openapi
+    schema = get_openapi(
         title=app.title,
         version=app.version,
         description=app.description,
         routes=app.routes,
     )
 
-    # [AI]: Start building the Markdown documentation
-    markdown_docs = f"# {app.title} API Documentation\n\n"
-    markdown_docs += "This document provides detailed information about the API endpoints for the project.\n\n"
+    if cache_path is not None:
+        try:
+            SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # [AI]: Only the newest schema is useful, so older entries are dropped before writing it
+            for old_path in SCHEMA_CACHE_DIR.glob("openapi-*.json"):
+                old_path.unlink()
+            cache_path.write_text(json.dumps(schema), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write the OpenAPI schema cache {cache_path}: {e}")
+    return schema
 
-    # [AI]: Generate table of contents
-    markdown_docs += "## Table of Contents\n"
-    for path in openapi_schema["paths"]:
+# [AI]: Function to generate API documentation in Markdown format
+def generate_api_docs(app: "FastAPI", source_dir: Optional[Path] = None) -> str:
+    # [AI]: Get the OpenAPI schema from the FastAPI app, cached on disk against the sources in source_dir
+    openapi_schema = get_openapi_schema(app, source_dir)
+
+    # [AI]: Serialized schemas by object id, so a schema shared by several media types is dumped once.
+    # The schema dict stays alive for the whole call, so the ids cannot be reused.
+    dumped = {}
+
+    def dump_schema(schema) -> str:
+        text = dumped.get(id(schema))
+        if text is None:
+            text = dumped[id(schema)] = _dumps(schema)
+        return text
+
+    # [AI]: Start building the Markdown documentation; pieces are collected in a list and joined once
+    parts = [
+        f"# {app.title} API Documentation\n\n",
+        "This document provides detailed information about the API endpoints for the project.\n\n",
+    ]
+
+    # [AI]: The table of contents and the endpoint sections are built in the same pass over the paths,
+    # then the contents are placed ahead of the body
+    toc_parts = []
+    body_parts = []
+    paths = openapi_schema["paths"]
+    for path, path_item in paths.items():
         endpoint_name = path.replace("/", "").capitalize()
-        markdown_docs += f"- [{endpoint_name}](#{endpoint_name.lower()})\n"
-    markdown_docs += "\n"
+        toc_parts.append(f"- [{endpoint_name}](#{endpoint_name.lower()})\n")
 
-    # [AI]: Generate documentation for each endpoint
-    for path, path_item in openapi_schema["paths"].items():
-        endpoint_name = path.replace("/", "").capitalize()
-        markdown_docs += f"## {endpoint_name}\n"
-        markdown_docs += f"**Base URL:** `{path}`\n"
+        # [AI]: Generate documentation for the endpoint
+        body_parts.append(f"## {endpoint_name}\n")
+        body_parts.append(f"**Base URL:** `{path}`\n")
 
         for method, operation in path_item.items():
-            markdown_docs += f"### {method.upper()}\n"
-            markdown_docs += f"**Summary:** {operation.get('summary', 'N/A')}\n"
-            markdown_docs += f"**Description:** {operation.get('description', 'N/A')}\n"
+            body_parts.append(f"### {method.upper()}\n")
+            body_parts.append(f"**Summary:** {operation.get('summary', 'N/A')}\n")
+            body_parts.append(f"**Description:** {operation.get('description', 'N/A')}\n")
 
             # [AI]: Document parameters
             if "parameters" in operation:
-                markdown_docs += "#### Parameters\n"
-                markdown_docs += "| Name | Located In | Description | Required | Schema |\n"
-                markdown_docs += "|------|------------|-------------|----------|--------|\n"
+                body_parts.append("#### Parameters\n")
+                body_parts.append("| Name | Located In | Description | Required | Schema |\n")
+                body_parts.append("|------|------------|-------------|----------|--------|\n")
                 for param in operation["parameters"]:
                     required = "Yes" if param.get('required', False) else "No"
                     schema = param.get('schema', {}).get('type', 'N/A')
-                    markdown_docs += f"| {param['name']} | {param['in']} | {param.get('description', 'N/A')} | {required} | {schema} |\n"
+                    body_parts.append(f"| {param['name']} | {param['in']} | {param.get('description', 'N/A')} | {required} | {schema} |\n")
 
             # [AI]: Document request body
             if "requestBody" in operation:
-                markdown_docs += "#### Request Body\n"
+                body_parts.append("#### Request Body\n")
                 content = operation["requestBody"]["content"]
                 for media_type, schema_info in content.items():
-                    markdown_docs += f"**Content-Type:** `{media_type}`\n"
+                    body_parts.append(f"**Content-Type:** `{media_type}`\n")
                     if "schema" in schema_info:
-                        markdown_docs += "**Schema:**\n```json\n"
-                        markdown_docs += json.dumps(schema_info["schema"], indent=2)
-                        markdown_docs += "\n```\n"
+                        body_parts.append("**Schema:**\n```json\n")
+                        body_parts.append(dump_schema(schema_info["schema"]))
+                        body_parts.append("\n```\n")
 
             # [AI]: Document responses
             if "responses" in operation:
-                markdown_docs += "#### Responses\n"
-                markdown_docs += "| Status Code | Description | Schema |\n"
-                markdown_docs += "|-------------|-------------|--------|\n"
+                body_parts.append("#### Responses\n")
+                body_parts.append("| Status Code | Description | Schema |\n")
+                body_parts.append("|-------------|-------------|--------|\n")
                 for status_code, response_info in operation["responses"].items():
-                    schema = "N/A"
-                    if "content" in response_info:
-                        for media_type, media_info in response_info["content"].items():
-                            if "schema" in media_info:
-                                schema = json.dumps(media_info["schema"], indent=2)
-                    markdown_docs += f"| {status_code} | {response_info.get('description', 'N/A')} | {schema} |\n"
+                    # [AI]: Only the last media type with a schema is shown, so only that one is serialized
+                    last_schema = None
+                    for media_info in response_info.get("content", {}).values():
+                        if "schema" in media_info:
+                            last_schema = media_info["schema"]
+                    schema = dump_schema(last_schema) if last_schema is not None else "N/A"
+                    body_parts.append(f"| {status_code} | {response_info.get('description', 'N/A')} | {schema} |\n")
 
-            markdown_docs += "\n---\n"
+            body_parts.append("\n---\n")
 
-    return markdown_docs
+    parts.append("## Table of Contents\n")
+    parts.extend(toc_parts)
+    parts.append("\n")
+    parts.extend(body_parts)
+
+    return "".join(parts)
 
 # [AI]: Main function to orchestrate the API documentation generation process
 def main():
@@ -158,10 +254,6 @@ def main():
         print(error_message(f"Could not find main.py at {main_py_path}"))
         return
 
-    # [AI]: Add the project root and backend directory to sys.path
-    sys.path.append(str(root_dir))
-    sys.path.append(str(root_dir / "backend"))
-
     # [AI]: Import the FastAPI app
     try:
         app = import_app(main_py_path)
@@ -174,7 +266,7 @@ def main():
 
     # [AI]: Generate API documentation
     print(info_message("Generating API documentation..."))
-    api_docs = generate_api_docs(app)
+    api_docs = generate_api_docs(app, root_dir / "backend")
     print(f"{SUCCESS_COLOR}Generated:{Style.RESET_ALL} API documentation generated successfully")
 
     # [AI]: Define the output file path
@@ -185,7 +277,7 @@ def main():
 
     # [AI]: Write the API documentation to the file at the specified path
     try:
-        with output_path.open("w", encoding="utf-8") as f:
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
             f.write(api_docs)
         relative_path = output_path.relative_to(root_dir)
         print(f"{SUCCESS_COLOR}Updated:{Style.RESET_ALL} API documentation in {file_path_message(str(relative_path))}")
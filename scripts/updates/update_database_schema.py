@@ -1,7 +1,7 @@
 # [AI]: This file implements a database schema documentation generator.
 # It provides functionality to scan Python files for SQLAlchemy models and generate a Markdown file with the database schema.
 # Key features:
-# - Automatic discovery of SQLAlchemy models in the project
+# - Automatic discovery of SQLAlchemy models through the declarative Base's metadata
 # - Generation of a formatted Markdown file with table and column details
 # - Colored console output for better readability
 # - Error handling and logging
@@ -15,9 +15,7 @@ backend_dir = project_root / 'backend'
 sys.path.extend([str(project_root), str(backend_dir)])
 
 import importlib
-import inspect
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, ForeignKey
+import pkgutil
 import logging
 from colorama import Fore, Style, init
 import traceback
@@ -56,9 +54,17 @@ def file_path_message(message: str) -> str:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# [AI]: Function to check if a class is a SQLAlchemy model
-def is_sqlalchemy_model(cls):
-    return hasattr(cls, '__tablename__') and hasattr(cls, '__table__')
+# [AI]: Function to import every module of the app.models package so each model registers its table
+# on the shared declarative Base; returns the tracebacks of any modules that failed to import
+def import_model_modules(models_dir):
+    errors = []
+    for module_info in pkgutil.iter_modules([str(models_dir)]):
+        module_name = f"app.models.{module_info.name}"
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            errors.append((module_name, traceback.format_exc()))
+    return errors
 
 # [AI]: Main function to update the database schema documentation
 def update_database_schema():
@@ -75,29 +81,30 @@ def update_database_schema():
         output_messages.append(f"Models directory not found: {models_dir}")
         return False, output_messages
 
-    models = {}  # Use a dictionary to prevent duplicate models
-
     print(info_message(f"Scanning directory: {models_dir}"))
-    # Iterate through Python files in the models directory
-    for file_path in models_dir.glob('*.py'):
-        if file_path.name != '__init__.py':
-            module_name = f"backend.app.models.{file_path.stem}"
-            try:
-                # Dynamically import the module and find SQLAlchemy models
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and is_sqlalchemy_model(obj):
-                        if name not in models:
-                            models[name] = obj
-                            print(success_message(f"Found model: {name}"))
-            except Exception as e:
-                print(error_message(f"Error importing {file_path.name}:"))
-                print(traceback.format_exc())
-                output_messages.append(f"Error importing {file_path.name}:")
-                output_messages.append(traceback.format_exc())
+    for module_name, error_details in import_model_modules(models_dir):
+        print(error_message(f"Error importing {module_name}:"))
+        print(error_details)
+        output_messages.append(f"Error importing {module_name}:")
+        output_messages.append(error_details)
+
+    # [AI]: Every model is already registered on Base, so read the tables straight from its metadata,
+    # in dependency order, and label each with the name of the class mapped to it
+    try:
+        from app.models.base import Base
+    except Exception as e:
+        error_msg = f"Error importing app.models.base: {e}"
+        print(error_message(error_msg))
+        print(traceback.format_exc())
+        output_messages.append(error_msg)
+        output_messages.append(traceback.format_exc())
+        return False, output_messages
+    class_names = {mapper.local_table: mapper.class_.__name__ for mapper in Base.registry.mappers}
+    models = {}
+    for table in Base.metadata.sorted_tables:
+        model_name = class_names.get(table, table.name)
+        models[model_name] = table
+        print(success_message(f"Found model: {model_name}"))
 
     if not models:
         error_msg = "No models found in any file"
@@ -108,8 +115,9 @@ def update_database_schema():
     print(info_message("\nGenerating database schema documentation..."))
     output_messages.append("Generating database schema documentation...")
 
-    # [AI]: Write the database schema documentation to the output file
-    with open(output_file, 'w') as f:
+    # [AI]: Write the database schema documentation to the output file; the 1 MiB buffer
+    # coalesces the many small per-row writes below into a few large ones
+    with open(output_file, 'w', buffering=1 << 20) as f:
         f.write("# Database Schema Documentation\n\n")
         f.write("This document provides detailed information about the database schema for the project.\n\n")
         f.write("## Table of Contents\n\n")
@@ -121,14 +129,16 @@ def update_database_schema():
         f.write("\n")
 
         # [AI]: Generate detailed information for each model
-        for model_name, model in models.items():
+        for model_name, table in models.items():
             f.write(f"## {model_name}\n\n")
-            f.write(f"Table name: `{model.__tablename__}`\n\n")
+            f.write(f"Table name: `{table.name}`\n\n")
             f.write("| Column | Type | Constraints |\n")
             f.write("|--------|------|-------------|\n")
 
-            # [AI]: Iterate through columns and document their properties
-            for column in model.__table__.columns:
+            # [AI]: Iterate through columns and document their properties; the rows of a table are
+            # collected and written together, and each column type is compiled to a string only once
+            rows = []
+            for column in table.columns:
                 constraints = []
                 if column.primary_key:
                     constraints.append("PRIMARY KEY")
@@ -136,14 +146,13 @@ def update_database_schema():
                     constraints.append("UNIQUE")
                 if not column.nullable:
                     constraints.append("NOT NULL")
-                if isinstance(column.type, ForeignKey):
-                    constraints.append(f"FOREIGN KEY ({column.name}) REFERENCES {column.type.column.table.name}({column.type.column.name})")
-                elif column.foreign_keys:
-                    for fk in column.foreign_keys:
-                        constraints.append(f"FOREIGN KEY ({fk.parent.name}) REFERENCES {fk.column.table.name}({fk.column.name})")
-                
-                f.write(f"| {column.name} | {column.type} | {', '.join(constraints)} |\n")
+                for fk in column.foreign_keys:
+                    constraints.append(f"FOREIGN KEY ({fk.parent.name}) REFERENCES {fk.column.table.name}({fk.column.name})")
+
+                column_type = str(column.type)
+                rows.append(f"| {column.name} | {column_type} | {', '.join(constraints)} |\n")
 
+            f.write("".join(rows))
             f.write("\n")
 
     # [AI]: Print success message with the relative path of the output file
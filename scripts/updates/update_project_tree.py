@@ -8,9 +8,9 @@
 # - Writes the generated tree to a markdown file
 
 import os
+import functools
 from pathlib import Path
 import logging
-import sys
 from colorama import Fore, Style, init
 
 # [AI]: Initialize colorama for cross-platform colored terminal output
@@ -47,10 +47,8 @@ def file_path_message(message: str) -> str:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# [AI]: Increase recursion limit to handle deep directory structures
-sys.setrecursionlimit(10000)
-
-# [AI]: Function to find the project root directory
+# [AI]: Function to find the project root directory, memoized per start path
+@functools.lru_cache(maxsize=None)
 def find_project_root(start_path: Path) -> Path:
     """
     Traverse up the directory tree to find the project root.
@@ -63,38 +61,58 @@ def find_project_root(start_path: Path) -> Path:
         current_path = current_path.parent
     raise FileNotFoundError("Could not find project root. Make sure you're in a git repository or have a pyproject.toml file.")
 
-# [AI]: Function to generate the project tree structure
-def get_project_tree(path: Path, indent_level: int = 0, top_level_only: set = None) -> list:
-    """
-    Recursively generate a tree-like structure of the project directory.
-    Handles permissions and errors, and skips certain directories.
-    """
-    if top_level_only is None:
-        top_level_only = {"node_modules", ".next", "venv", ".ai", "alembic"}
-    
-    tree = []
+# [AI]: Directories listed in the tree without their contents: dependencies, VCS data, caches and build output
+_SKIP_RECURSE = frozenset({
+    "node_modules", ".next", "venv", ".ai", "alembic",
+    ".git", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".tox", ".cache", "dist", "build",
+})
+
+# [AI]: Entries left out of the tree entirely
+_SKIP_ENTIRELY = frozenset({"__pycache__"})
+
+# [AI]: Function to list a directory's entries sorted alphabetically, with directories first.
+# Hidden entries are dropped before sorting so they never reach the sort.
+def _sorted_entries(path: str) -> list:
     try:
-        # [AI]: Sort items alphabetically, with directories first
-        items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+        with os.scandir(path) as it:
+            entries = [e for e in it if e.name not in _SKIP_ENTIRELY]
+        entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+        return entries
     except PermissionError:
         logger.warning(warning_message("Warning:", f"Permission denied: {path}"))
-        return tree
     except Exception as e:
         logger.error(error_message(f"Error accessing {path}: {e}"))
-        return tree
-    
-    for item in items:
-        if item.name == "__pycache__":
-            continue
-        
-        indent = "    " * indent_level
-        if item.is_dir():
-            tree.append(f"{indent}├── {item.name}/")
-            if item.name not in top_level_only:
-                tree.extend(get_project_tree(item, indent_level + 1, top_level_only))
+    return []
+
+# [AI]: Function to generate the project tree structure
+def get_project_tree(path, indent_level: int = 0) -> list:
+    """
+    Generate a tree-like structure of the project directory, depth first.
+    Handles permissions and errors, and skips certain directories.
+    The walk works on plain string paths and scandir entries; no Path objects are built per entry.
+    """
+    tree = []
+    append = tree.append
+    # [AI]: An explicit stack of (remaining entries, line prefix, depth) replaces recursion; a directory's
+    # subtree is pushed right after its own line, so the output order is the same as a recursive walk.
+    # The prefix is built once per directory rather than once per entry, and the inner for loop runs
+    # through a directory's files without going back to the stack until it has to descend.
+    stack = [(iter(_sorted_entries(os.fspath(path))), "    " * indent_level + "├── ", indent_level)]
+    while stack:
+        entries, prefix, depth = stack[-1]
+        for item in entries:
+            name = item.name
+            if item.is_dir(follow_symlinks=False):
+                append(prefix + name + "/")
+                # [AI]: Skipped directories get their own line but are never opened
+                if name not in _SKIP_RECURSE:
+                    stack.append((iter(_sorted_entries(item.path)), "    " * (depth + 1) + "├── ", depth + 1))
+                    break
+            else:
+                append(prefix + name)
         else:
-            tree.append(f"{indent}├── {item.name}")
-    
+            stack.pop()
+
     return tree
 
 # [AI]: Main function to orchestrate the project tree generation and file writing
@@ -115,7 +133,7 @@ def main():
     # [AI]: Generate the project tree
     print(info_message("Generating project tree..."))
     tree_output = [project_name.upper()]
-    tree_output.extend(get_project_tree(root_dir))
+    tree_output.extend(get_project_tree(os.fspath(root_dir)))
     print(f"{SUCCESS_COLOR}Generated:{Style.RESET_ALL} Project tree generated successfully")
 
     # [AI]: Define the output file path
@@ -126,10 +144,12 @@ def main():
 
     # [AI]: Write the generated tree to a markdown file
     try:
-        with output_path.open("w", encoding="utf-8") as f:
+        # [AI]: A 1 MiB buffer lets even a large tree go out in a handful of write calls; the lines are
+        # streamed into it rather than joined into one large string first
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
             f.write("```markdown\n")
-            f.write("\n".join(tree_output))
-            f.write("\n```")
+            f.writelines(line + "\n" for line in tree_output)
+            f.write("```")
         relative_path = output_path.relative_to(root_dir)
         print(f"{SUCCESS_COLOR}Updated:{Style.RESET_ALL} Project tree in {file_path_message(str(relative_path))}")
     except IOError as e:
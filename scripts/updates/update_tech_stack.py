@@ -10,7 +10,6 @@ import os
 from pathlib import Path
 import logging
 import json
-import re
 from colorama import Fore, Style, init
 
 # [AI]: Initialize colorama for cross-platform colored terminal output
@@ -60,12 +59,30 @@ def find_file(filename, start_dir=PROJECT_ROOT, max_depth=5):
             del dirs[:]
     return None
 
+# [AI]: Usual locations of the files this script needs. requirements.txt and package.json are the
+# root-level ones, which is also what the top-down find_file walk returns first.
+KNOWN_PATHS = {
+    "tech_stack.md": PROJECT_ROOT / "workspace" / "files" / "tech_stack.md",
+    "requirements.txt": PROJECT_ROOT / "requirements.txt",
+    "package.json": PROJECT_ROOT / "package.json",
+}
+
 # [AI]: Parse Python requirements file to extract production and development dependencies
 def parse_requirements(requirements_path):
+    prod_deps, dev_deps = [], []
+    # [AI]: Pinned lines go to production until the development marker is seen
+    section = prod_deps
     with open(requirements_path, 'r') as file:
-        content = file.read()
-        prod_deps = re.findall(r'^(.+)==.+$', content, re.MULTILINE)
-        dev_deps = re.findall(r'^(.+)==.+$', content[content.find('# Development Dependencies'):], re.MULTILINE)
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                if 'Development Dependencies' in line:
+                    section = dev_deps
+                continue
+            if '==' in line:
+                section.append(line.split('==', 1)[0].strip())
     return {'production': prod_deps, 'development': dev_deps}
 
 # [AI]: Parse package.json file to extract JavaScript dependencies and devDependencies
@@ -86,9 +103,10 @@ def update_tech_stack():
     files_to_find = ['tech_stack.md', 'requirements.txt', 'package.json']
     found_files = {}
 
-    # [AI]: Find and log the location of each required file
+    # [AI]: Find and log the location of each required file, trying its usual location before walking the tree
     for file in files_to_find:
-        found_files[file] = find_file(file)
+        known_path = KNOWN_PATHS[file]
+        found_files[file] = known_path if known_path.is_file() else find_file(file)
         if found_files[file]:
             print(info_message(f"Found {file} at: {file_path_message(str(found_files[file]))}"))
         else:
@@ -117,7 +135,7 @@ def update_tech_stack():
     print(info_message("Updating tech_stack.md..."))
     # [AI]: Write the generated content to the tech_stack.md file
     try:
-        with open(found_files['tech_stack.md'], 'w') as file:
+        with open(found_files['tech_stack.md'], 'w', buffering=1 << 20) as file:
             file.write(content)
         relative_path = found_files['tech_stack.md'].relative_to(PROJECT_ROOT)
         print(f"{SUCCESS_COLOR}Updated:{Style.RESET_ALL} Tech stack in {file_path_message(str(relative_path))}")